@@ -63,18 +63,17 @@ class ProductionDeepGramClient:
 class MockDeepGramClient:
     """Mock DeepGram client for testing and development."""
 
-    def __init__(self):
-        """Initialize mock client."""
-        self.mock_responses = [
-            "Could probably go heavier next session",
-            "Felt strong today, good form",
-            "Lower back was tight, need to stretch more",
-            "Rest pause set, pushed through the burn",
-            "Form was sloppy on the last few reps",
-            "Great pump today, muscles felt activated",
-            "Need to focus on mind-muscle connection",
-            "Shoulders felt tight during the movement",
-        ]
+    # Shared by every instance; the dependency builds a new client per request
+    mock_responses: tuple[str, ...] = (
+        "Could probably go heavier next session",
+        "Felt strong today, good form",
+        "Lower back was tight, need to stretch more",
+        "Rest pause set, pushed through the burn",
+        "Form was sloppy on the last few reps",
+        "Great pump today, muscles felt activated",
+        "Need to focus on mind-muscle connection",
+        "Shoulders felt tight during the movement",
+    )
 
     async def transcribe_audio(self, audio_file: BinaryIO) -> TranscriptionResponse:
         """Mock transcription for development/testing."""
@@ -48,6 +48,9 @@ class ExerciseExecution(BaseModel):
     """ExerciseExecution model for exercises performed in a workout."""
 
     __tablename__ = "exercise_executions"
+    # Fetch the onupdate timestamp via UPDATE ... RETURNING so upserts do not
+    # need a refresh before building the response
+    __mapper_args__ = {"eager_defaults": True}
 
     workout_id: Mapped[int] = mapped_column(
         ForeignKey("workouts.id"),
@@ -3,7 +3,7 @@
 import logging
 from datetime import UTC, datetime
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -114,7 +114,9 @@ class WorkoutRepository:
         workout.finished_at = datetime.now(UTC).replace(tzinfo=None)
         workout.updated_by_user_id = user_id
         await self.session.flush()
-        await self.session.refresh(workout)
+        # Only reload the onupdate timestamp; a full refresh cascades to the
+        # loaded executions and expires their sets
+        await self.session.refresh(workout, ["updated_at"])
         return workout
 
     async def delete(self, workout_id: int, user_id: int) -> bool:
@@ -130,18 +132,17 @@ class WorkoutRepository:
         self, workout_id: int, exercise_id: int, user_id: int
     ) -> tuple[ExerciseExecution, list[Set]] | None:
         """Get exercise execution with sets."""
-        # First verify workout exists and user has permission
-        workout = await self.get_by_id(workout_id, user_id)
-        if not workout:
-            return None
-
+        # Check workout ownership in the same query instead of loading the
+        # whole workout tree first; sets arrive in one selectinload query
         stmt = (
             select(ExerciseExecution)
+            .join(Workout, ExerciseExecution.workout_id == Workout.id)
             .options(selectinload(ExerciseExecution.sets))
             .where(
                 and_(
                     ExerciseExecution.workout_id == workout_id,
                     ExerciseExecution.exercise_id == exercise_id,
+                    Workout.created_by_user_id == user_id,
                 )
             )
         )
@@ -160,23 +161,29 @@ class WorkoutRepository:
         user_id: int,
     ) -> tuple[ExerciseExecution, list[Set]]:
         """Create or update exercise execution with full replacement of sets."""
-        # Verify workout exists and user has permission
-        workout = await self.get_by_id(workout_id, user_id)
+        # Verify workout exists and user has permission; only the row itself is
+        # needed here, so skip the executions/sets loaders of get_by_id
+        workout = await self.session.scalar(
+            select(Workout).where(
+                and_(
+                    Workout.id == workout_id,
+                    Workout.created_by_user_id == user_id,
+                )
+            )
+        )
         if not workout:
             raise NotFoundError(f"Workout with ID {workout_id} not found")
 
         if workout.finished_at is not None:
             raise ValidationError("Cannot modify finished workout")
 
-        # Verify exercise exists
-        exercise_stmt = select(Exercise).where(Exercise.id == exercise_id)
-        exercise_result = await self.session.execute(exercise_stmt)
-        exercise = exercise_result.scalar_one_or_none()
+        # Verify exercise exists with a primary-key lookup
+        exercise = await self.session.get(Exercise, exercise_id)
         if not exercise:
             raise NotFoundError(f"Exercise with ID {exercise_id} not found")
 
         # Check if exercise execution already exists
-        existing_execution = await self.session.execute(
+        execution = await self.session.scalar(
             select(ExerciseExecution).where(
                 and_(
                     ExerciseExecution.workout_id == workout_id,
@@ -184,20 +191,23 @@ class WorkoutRepository:
                 )
             )
         )
-        execution = existing_execution.scalar_one_or_none()
 
         if execution:
             # Update existing execution
             execution.exercise_order = data.exercise_order
             execution.note_text = data.note_text
 
-            # Delete all existing sets using ORM (leverages cascade relationships)
-            for existing_set in execution.sets:
-                await self.session.delete(existing_set)
-
-            # Clear the sets relationship to reflect the deletion
-            execution.sets.clear()
-            await self.session.flush()  # Ensure deletions are visible
+            # Delete all existing sets in one statement instead of loading them
+            # first; the stale collection is expired so it reloads on next use
+            await self.session.execute(
+                delete(Set).where(
+                    and_(
+                        Set.workout_id == workout_id,
+                        Set.exercise_id == exercise_id,
+                    )
+                )
+            )
+            self.session.expire(execution, ["sets"])
         else:
             # Create new execution
             execution = ExerciseExecution(
@@ -209,9 +219,8 @@ class WorkoutRepository:
             self.session.add(execution)
 
         # Create new sets
-        sets = []
-        for set_data in data.sets:
-            new_set = Set(
+        sets = [
+            Set(
                 workout_id=workout_id,
                 exercise_id=exercise_id,
                 note_text=set_data.note_text,
@@ -219,13 +228,13 @@ class WorkoutRepository:
                 clean_reps=set_data.clean_reps,
                 forced_reps=set_data.forced_reps,
             )
-            self.session.add(new_set)
-            sets.append(new_set)
+            for set_data in data.sets
+        ]
+        self.session.add_all(sets)
 
+        # One flush batches the new sets into a single multi-row
+        # INSERT ... RETURNING, which also fills their ids and timestamps
         await self.session.flush()
-        await self.session.refresh(execution)
-        for set_obj in sets:
-            await self.session.refresh(set_obj)
 
         return execution, sets
 
@@ -286,9 +295,12 @@ class WorkoutRepository:
                 f"Exercise execution not found for workout {workout_id} and exercise {exercise_id}"
             )
 
+        # Linking the execution keeps its sets collection current when the
+        # workout load above already populated it
         new_set = Set(
             workout_id=workout_id,
             exercise_id=exercise_id,
+            exercise_execution=execution,
             note_text=set_data.note_text,
             weight=set_data.weight,
             clean_reps=set_data.clean_reps,
@@ -419,15 +431,10 @@ class WorkoutRepository:
         if workout.finished_at is not None:
             raise ValidationError("Cannot modify finished workout")
 
-        # Get all exercise executions for this workout
-        executions_stmt = select(ExerciseExecution).where(
-            ExerciseExecution.workout_id == workout_id
-        )
-        executions_result = await self.session.execute(executions_stmt)
-        executions = executions_result.scalars().all()
-
-        # Verify all provided exercise_ids exist in the workout
-        existing_exercise_ids = {execution.exercise_id for execution in executions}
+        # get_by_id already loaded the executions, so validate against them
+        existing_exercise_ids = {
+            execution.exercise_id for execution in workout.exercise_executions
+        }
         provided_exercise_ids = set(exercise_ids)
 
         if existing_exercise_ids != provided_exercise_ids:
@@ -440,17 +447,32 @@ class WorkoutRepository:
                 error_msg += f". Extra: {extra}"
             raise ValidationError(error_msg)
 
-        # Update exercise order
-        execution_map = {execution.exercise_id: execution for execution in executions}
-        updated_executions = []
+        if not exercise_ids:
+            return []
 
-        for order, exercise_id in enumerate(exercise_ids, start=1):
-            execution = execution_map[exercise_id]
-            execution.exercise_order = order
-            updated_executions.append(execution)
-
-        await self.session.flush()
-        for execution in updated_executions:
-            await self.session.refresh(execution)
+        # Set every new position in one UPDATE ... RETURNING
+        new_order = case(
+            {
+                exercise_id: order
+                for order, exercise_id in enumerate(exercise_ids, start=1)
+            },
+            value=ExerciseExecution.exercise_id,
+        )
+        stmt = (
+            update(ExerciseExecution)
+            .where(
+                and_(
+                    ExerciseExecution.workout_id == workout_id,
+                    ExerciseExecution.exercise_id.in_(exercise_ids),
+                )
+            )
+            .values(exercise_order=new_order)
+            .returning(ExerciseExecution)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        updated_executions = sorted(
+            result.scalars().all(), key=lambda execution: execution.exercise_order
+        )
 
         return updated_executions
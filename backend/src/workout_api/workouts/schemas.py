@@ -152,6 +152,8 @@ class ExerciseReorderResponse(BaseModel):
 class Pagination(BaseModel):
     """Pagination parameters."""
 
+    model_config = {"frozen": True}
+
     page: int = Field(1, ge=1, description="Page number (1-based)")
     size: int = Field(20, ge=1, le=100, description="Page size (max 100)")
 
@@ -1,9 +1,11 @@
 """Workout service for business logic and data conversion."""
 
 import logging
+from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ..exercises.models import Exercise
 from ..shared.exceptions import NotFoundError
@@ -38,11 +40,19 @@ class WorkoutService:
     ) -> "Page[WorkoutResponse]":
         """Get user workouts with filters and pagination."""
         page = await self.repository.search(filters, pagination, user_id)
+        # One exercise query for the whole page rather than one per workout
+        exercises = await self._load_exercises(
+            [
+                execution
+                for workout in page.items
+                for execution in workout.exercise_executions
+            ]
+        )
 
         # Convert SQLAlchemy objects to Pydantic models within session context
         workout_responses = []
         for workout in page.items:
-            workout_response = await self._workout_to_response(workout)
+            workout_response = await self._workout_to_response(workout, exercises)
             workout_responses.append(workout_response)
 
         return Page.create(workout_responses, page.total, pagination)
@@ -286,8 +296,14 @@ class WorkoutService:
             exercise_executions=execution_responses,
         )
 
-    async def _workout_to_response(self, workout: Workout) -> WorkoutResponse:
-        """Convert Workout SQLAlchemy object to Pydantic model."""
+    async def _workout_to_response(
+        self, workout: Workout, exercises: dict[int, Exercise] | None = None
+    ) -> WorkoutResponse:
+        """Convert Workout SQLAlchemy object to Pydantic model.
+
+        ``exercises`` maps exercise ID to Exercise for every execution in the
+        workout; it is loaded here in one query when not supplied.
+        """
         # Extract basic attributes early to avoid lazy loading issues
         workout_id = workout.id
         finished_at = workout.finished_at
@@ -296,38 +312,29 @@ class WorkoutService:
         created_at = workout.created_at
         updated_at = workout.updated_at
 
-        # Get exercise executions via explicit query to avoid lazy loading issues
+        # The repository eager-loads executions and their sets; only workouts
+        # whose collection was expired since (e.g. by a refresh) are re-queried
         execution_responses = []
-        try:
-            # Query for exercise executions explicitly instead of using the relationship
+        if "exercise_executions" in inspect(workout).unloaded:
             execution_stmt = (
                 select(ExerciseExecution)
                 .where(ExerciseExecution.workout_id == workout_id)
                 .order_by(ExerciseExecution.exercise_order)
+                .options(selectinload(ExerciseExecution.sets))
             )
             execution_result = await self.session.execute(execution_stmt)
             executions = execution_result.scalars().all()
+        else:
+            executions = workout.exercise_executions
 
-            for execution in executions:
-                # Query for sets explicitly
-                set_stmt = (
-                    select(Set)
-                    .where(
-                        Set.workout_id == workout_id,
-                        Set.exercise_id == execution.exercise_id,
-                    )
-                    .order_by(Set.created_at)
-                )
-                set_result = await self.session.execute(set_stmt)
-                sets = set_result.scalars().all()
+        if exercises is None:
+            exercises = await self._load_exercises(executions)
 
-                execution_response = await self._exercise_execution_to_response(
-                    execution, list(sets)
-                )
-                execution_responses.append(execution_response)
-        except Exception:
-            # If anything fails, return empty exercise executions
-            execution_responses = []
+        for execution in executions:
+            execution_response = await self._exercise_execution_to_response(
+                execution, list(execution.sets), exercises[execution.exercise_id]
+            )
+            execution_responses.append(execution_response)
 
         return WorkoutResponse(
             id=workout_id,
@@ -339,8 +346,24 @@ class WorkoutService:
             exercise_executions=execution_responses,
         )
 
+    async def _load_exercises(
+        self, executions: Sequence[ExerciseExecution]
+    ) -> dict[int, Exercise]:
+        """Load the exercises of the given executions in one query, keyed by ID."""
+        exercise_ids = {execution.exercise_id for execution in executions}
+        if not exercise_ids:
+            return {}
+
+        result = await self.session.scalars(
+            select(Exercise).where(Exercise.id.in_(exercise_ids))
+        )
+        return {exercise.id: exercise for exercise in result}
+
     async def _exercise_execution_to_response(
-        self, execution: ExerciseExecution, sets: list[Set]
+        self,
+        execution: ExerciseExecution,
+        sets: list[Set],
+        exercise: Exercise | None = None,
     ) -> ExerciseExecutionResponse:
         """Convert ExerciseExecution SQLAlchemy object to Pydantic model."""
         # Extract attributes early to avoid lazy loading issues
@@ -350,15 +373,12 @@ class WorkoutService:
         created_at = execution.created_at
         updated_at = execution.updated_at
 
-        # Get exercise details - need to query exercise table
-        exercise_stmt = select(
-            Exercise.name, Exercise.body_part, Exercise.modality
-        ).where(Exercise.id == exercise_id)
-        exercise_result = await self.session.execute(exercise_stmt)
-        exercise_row = exercise_result.one()
-        exercise_name = exercise_row.name
-        exercise_body_part = exercise_row.body_part
-        exercise_modality = exercise_row.modality.value  # Convert enum to string
+        # Get exercise details by primary key unless the caller already has it
+        if exercise is None:
+            exercise = await self.session.get(Exercise, exercise_id)
+        exercise_name = exercise.name
+        exercise_body_part = exercise.body_part
+        exercise_modality = exercise.modality.value  # Convert enum to string
 
         # Convert sets to Pydantic models
         set_responses = [SetResponse.model_validate(set_obj) for set_obj in sets]
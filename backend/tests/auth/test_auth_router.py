@@ -189,7 +189,6 @@ class TestAuthRouterSession:
     async def test_logout_success(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successful logout."""
         # Act
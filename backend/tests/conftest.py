@@ -1,12 +1,14 @@
 """Test configuration with anyio and transaction isolation."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, raiseload
+from sqlalchemy.orm import Session as SyncSession
 from testcontainers.postgres import PostgresContainer
 
 from workout_api.auth.dependencies import get_current_user_from_token
@@ -28,10 +30,25 @@ def anyio_backend():
     return "asyncio"
 
 
+# Durability settings that only cost time in a throwaway test database
+POSTGRES_TEST_COMMAND = (
+    "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+)
+
+
 @pytest.fixture(scope="session")
 def postgres_container():
-    """Start PostgreSQL container for entire test session."""
-    with PostgresContainer("postgres:16", driver="asyncpg") as postgres:
+    """Start PostgreSQL container for entire test session.
+
+    The data directory lives on tmpfs and durability is switched off, so writes
+    never wait on disk.
+    """
+    container = PostgresContainer(
+        "postgres:16",
+        driver="asyncpg",
+        tmpfs={"/var/lib/postgresql/data": "rw"},
+    ).with_command(POSTGRES_TEST_COMMAND)
+    with container as postgres:
         yield postgres
 
 
@@ -59,40 +76,110 @@ async def test_engine(postgres_container, anyio_backend):  # noqa: ARG001
         await engine.dispose()
 
 
-@pytest.fixture
-async def session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test session with transaction isolation."""
+@pytest.fixture(scope="session")
+async def db_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open one connection with an outer transaction for the whole session.
+
+    Nothing is ever committed to the database: package-level seed data and
+    per-test changes live in savepoints nested inside this transaction.
+    """
     async with test_engine.connect() as connection:
-        # Begin external transaction
         trans = await connection.begin()
-
-        # Create session with savepoint mode for transaction isolation
-        session = AsyncSession(
-            bind=connection, join_transaction_mode="create_savepoint"
-        )
-
         try:
-            yield session
+            yield connection
         finally:
-            await session.close()
-            # Rollback the external transaction - undoes all changes
             await trans.rollback()
 
 
 @pytest.fixture
-async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def session(db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
+    """Create test session with savepoint isolation."""
+    # Per-test savepoint - rolling it back undoes everything the test did,
+    # including work the session "committed" into it
+    savepoint = await db_connection.begin_nested()
+
+    # Create session with savepoint mode for transaction isolation.
+    # expire_on_commit=False keeps fixture objects readable after service
+    # commits (which only release the savepoint) without lazy reloads.
+    session = AsyncSession(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+    try:
+        yield session
+    finally:
+        await session.close()
+        await savepoint.rollback()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def raise_on_lazy_load() -> Generator[None, None, None]:
+    """Add ``raiseload("*")`` to every ORM SELECT issued during the test run.
+
+    Any relationship the code reads without eager loading it raises instead of
+    quietly costing a round trip per row, so N+1 patterns fail the tests.
+    Loader queries SQLAlchemy issues itself (selectinload, refresh) are left
+    alone.
+    """
+
+    def _add_raiseload(state: ORMExecuteState) -> None:
+        if state.is_select and not (state.is_relationship_load or state.is_column_load):
+            state.statement = state.statement.options(raiseload("*"))
+
+    event.listen(SyncSession, "do_orm_execute", _add_raiseload)
+    try:
+        yield
+    finally:
+        event.remove(SyncSession, "do_orm_execute", _add_raiseload)
+
+
+@pytest.fixture
+def query_counter(test_engine) -> Generator[list[str], None, None]:
+    """Record the SQL statements the test engine executes during a test.
+
+    Savepoint bookkeeping is left out: it only exists because of the test
+    transaction isolation, so the list reflects what production would run.
+    Clear the list right before the code under test to drop fixture setup.
+    """
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, *args):  # noqa: ARG001
+        if "SAVEPOINT" not in statement:
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one in-process ASGI client reused by every test in the session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture
+async def client(
+    session: AsyncSession, http_client: AsyncClient
+) -> AsyncGenerator[AsyncClient, None]:
     """Create async test client with database dependency override."""
 
     async def override_get_session():
         yield session
 
     app.dependency_overrides[get_session] = override_get_session
+    # The client outlives the test, so drop anything a previous test left behind
+    http_client.cookies.clear()
 
     try:
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as ac:
-            yield ac
+        yield http_client
     finally:
         # Clean up dependency overrides
         app.dependency_overrides.clear()
@@ -128,7 +215,7 @@ def jwt_manager(test_settings: Settings) -> JWTManager:
 # ================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_data() -> dict[str, Any]:
     """Standard test user data - shared across modules."""
     return {
@@ -142,7 +229,7 @@ def test_user_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_admin_user_data() -> dict[str, Any]:
     """Standard test admin user data - shared across modules."""
     return {
@@ -156,7 +243,7 @@ def test_admin_user_data() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def another_user_data() -> dict[str, Any]:
     """Standard second user data for testing interactions - shared across modules."""
     return {
@@ -173,25 +260,11 @@ def another_user_data() -> dict[str, Any]:
 async def _create_user_from_data(
     session: AsyncSession, user_data: dict[str, Any]
 ) -> User:
-    """Helper function to create a user and extract attributes to prevent lazy loading."""
+    """Helper function to create a user with server defaults loaded."""
     user = User(**user_data)
     session.add(user)
     await session.flush()  # Get the ID without committing
     await session.refresh(user)
-
-    # Extract all attributes early to prevent MissingGreenlet errors
-    _ = (
-        user.id,
-        user.email_address,
-        user.google_id,
-        user.name,
-        user.profile_image_url,
-        user.is_active,
-        user.is_admin,
-        user.created_at,
-        user.updated_at,
-    )
-
     return user
 
 
@@ -259,11 +332,8 @@ async def authenticated_client(
     user_id = test_user.id
 
     async def override_get_current_user_from_token():
-        # Get a fresh user object from the database for each request to avoid detached instance issues
-        stmt = select(User).where(User.id == user_id)
-        result = await session.execute(stmt)
-        fresh_user = result.scalar_one()
-        return fresh_user
+        # Served from the identity map; only re-selected once the user is expired
+        return await session.get(User, user_id)
 
     app.dependency_overrides[get_current_user_from_token] = (
         override_get_current_user_from_token
@@ -284,11 +354,8 @@ async def admin_authenticated_client(
     user_id = test_admin_user.id
 
     async def override_get_current_user_from_token():
-        # Get a fresh user object from the database for each request to avoid detached instance issues
-        stmt = select(User).where(User.id == user_id)
-        result = await session.execute(stmt)
-        fresh_user = result.scalar_one()
-        return fresh_user
+        # Served from the identity map; only re-selected once the user is expired
+        return await session.get(User, user_id)
 
     app.dependency_overrides[get_current_user_from_token] = (
         override_get_current_user_from_token
@@ -321,11 +388,8 @@ async def another_authenticated_client(
     user_id = another_user.id
 
     async def override_get_current_user_from_token():
-        # Get a fresh user object from the database for each request to avoid detached instance issues
-        stmt = select(User).where(User.id == user_id)
-        result = await session.execute(stmt)
-        fresh_user = result.scalar_one()
-        return fresh_user
+        # Served from the identity map; only re-selected once the user is expired
+        return await session.get(User, user_id)
 
     app.dependency_overrides[get_current_user_from_token] = (
         override_get_current_user_from_token
@@ -1,7 +1,10 @@
 """Test transaction isolation between tests."""
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
+from workout_api.users.models import User
 from workout_api.users.repository import UserRepository
 
 # Mark all tests in this module as anyio tests
@@ -143,3 +146,37 @@ class TestTransactionIsolation:
 
         user = await user_repository.create(user_data)
         assert user.id is not None
+
+    async def test_committed_user_rolled_back(self, db_connection: AsyncConnection):
+        """A commit only releases the savepoint; rolling it back drops the user."""
+        # Same setup as the session fixture, but owned by the test so the
+        # rollback can be checked here rather than by a later test
+        savepoint = await db_connection.begin_nested()
+        async with AsyncSession(
+            bind=db_connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        ) as session:
+            user_repository = UserRepository(session)
+            await user_repository.create(
+                {
+                    "email_address": "committed@example.com",
+                    "google_id": "committed_google",
+                    "name": "Committed User",
+                    "is_active": True,
+                }
+            )
+            await session.commit()
+
+            # The session keeps working after the commit
+            found_user = await user_repository.get_by_email("committed@example.com")
+            assert found_user is not None
+
+        await savepoint.rollback()
+
+        committed_user_id = await db_connection.scalar(
+            select(User.id).where(User.email_address == "committed@example.com")
+        )
+        assert committed_user_id is None, (
+            "Committed user should be rolled back with the test's savepoint"
+        )
@@ -14,32 +14,8 @@ from workout_api.users.service import UserService
 # Mark all tests in this module as anyio tests
 pytestmark = pytest.mark.anyio
 
-
-@pytest.fixture
-async def inactive_user(session):
-    """Create an inactive user for testing."""
-    user = User(
-        email_address="inactive@example.com",
-        google_id="google456",
-        name="Inactive User",
-        is_active=False,
-    )
-    session.add(user)
-    await session.flush()
-    await session.refresh(user)
-    # Explicitly load all attributes to prevent lazy loading issues
-    _ = (
-        user.id,
-        user.email_address,
-        user.name,
-        user.is_active,
-        user.profile_image_url,
-        user.google_id,
-        user.is_admin,
-        user.created_at,
-        user.updated_at,
-    )
-    return user
+USERS_ME_URL = "/api/v1/users/me"
+USERS_ME_STATS_URL = f"{USERS_ME_URL}/stats"
 
 
 @pytest.fixture
@@ -48,22 +24,6 @@ def mock_user_service():
     return AsyncMock(spec=UserService)
 
 
-@pytest.fixture
-async def authenticated_client(client: AsyncClient, test_user: User):
-    """Create an authenticated client by overriding the auth dependency."""
-
-    async def override_get_current_user():
-        return test_user
-
-    app.dependency_overrides[get_current_user_from_token] = override_get_current_user
-
-    yield client
-
-    # Clean up
-    if get_current_user_from_token in app.dependency_overrides:
-        del app.dependency_overrides[get_current_user_from_token]
-
-
 class TestUserRouter:
     """Test cases for user API endpoints."""
 
@@ -77,7 +37,7 @@ class TestUserRouter:
         user_name = test_user.name
 
         # Act
-        response = await authenticated_client.get("/api/v1/users/me")
+        response = await authenticated_client.get(USERS_ME_URL)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -89,7 +49,7 @@ class TestUserRouter:
     async def test_get_current_user_profile_unauthenticated(self, client: AsyncClient):
         """Test current user profile retrieval without authentication."""
         # Act
-        response = await client.get("/api/v1/users/me")
+        response = await client.get(USERS_ME_URL)
 
         # Assert - FastAPI returns 403 when no credentials are provided with HTTPBearer
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -119,7 +79,7 @@ class TestUserRouter:
 
         try:
             # Act
-            response = await client.get("/api/v1/users/me")
+            response = await client.get(USERS_ME_URL)
 
             # Assert
             assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -142,9 +102,7 @@ class TestUserRouter:
         }
 
         # Act
-        response = await authenticated_client.patch(
-            "/api/v1/users/me", json=update_data
-        )
+        response = await authenticated_client.patch(USERS_ME_URL, json=update_data)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -161,9 +119,7 @@ class TestUserRouter:
         update_data = {"name": ""}
 
         # Act
-        response = await authenticated_client.patch(
-            "/api/v1/users/me", json=update_data
-        )
+        response = await authenticated_client.patch(USERS_ME_URL, json=update_data)
 
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -176,9 +132,7 @@ class TestUserRouter:
         update_data = {"profile_image_url": "not-a-valid-url"}
 
         # Act
-        response = await authenticated_client.patch(
-            "/api/v1/users/me", json=update_data
-        )
+        response = await authenticated_client.patch(USERS_ME_URL, json=update_data)
 
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -191,7 +145,7 @@ class TestUserRouter:
         update_data = {"name": "New Name"}
 
         # Act
-        response = await client.patch("/api/v1/users/me", json=update_data)
+        response = await client.patch(USERS_ME_URL, json=update_data)
 
         # Assert - FastAPI returns 403 when no credentials are provided with HTTPBearer
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -199,11 +153,10 @@ class TestUserRouter:
     async def test_get_user_statistics_success(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successful user statistics retrieval."""
         # Act
-        response = await authenticated_client.get("/api/v1/users/me/stats")
+        response = await authenticated_client.get(USERS_ME_STATS_URL)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -224,7 +177,7 @@ class TestUserRouter:
         """Test user statistics retrieval with date range parameters."""
         # Act
         response = await authenticated_client.get(
-            "/api/v1/users/me/stats",
+            USERS_ME_STATS_URL,
             params={
                 "start_date": "2024-01-01T00:00:00",
                 "end_date": "2024-12-31T23:59:59",
@@ -240,7 +193,7 @@ class TestUserRouter:
         """Test user statistics retrieval with invalid date range."""
         # Act
         response = await authenticated_client.get(
-            "/api/v1/users/me/stats",
+            USERS_ME_STATS_URL,
             params={
                 "start_date": "2024-12-31T23:59:59",
                 "end_date": "2024-01-01T00:00:00",
@@ -254,7 +207,7 @@ class TestUserRouter:
     async def test_get_user_statistics_unauthenticated(self, client: AsyncClient):
         """Test user statistics retrieval without authentication."""
         # Act
-        response = await client.get("/api/v1/users/me/stats")
+        response = await client.get(USERS_ME_STATS_URL)
 
         # Assert - FastAPI returns 403 when no credentials are provided with HTTPBearer
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -262,11 +215,10 @@ class TestUserRouter:
     async def test_deactivate_current_user_success(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successful current user deactivation."""
         # Act
-        response = await authenticated_client.delete("/api/v1/users/me")
+        response = await authenticated_client.delete(USERS_ME_URL)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -276,7 +228,7 @@ class TestUserRouter:
     async def test_deactivate_current_user_unauthenticated(self, client: AsyncClient):
         """Test current user deactivation without authentication."""
         # Act
-        response = await client.delete("/api/v1/users/me")
+        response = await client.delete(USERS_ME_URL)
 
         # Assert - FastAPI returns 403 when no credentials are provided with HTTPBearer
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -284,17 +236,15 @@ class TestUserRouter:
     async def test_endpoints_content_type_json(self, authenticated_client: AsyncClient):
         """Test that endpoints return JSON content type."""
         # Test GET profile
-        response = await authenticated_client.get("/api/v1/users/me")
+        response = await authenticated_client.get(USERS_ME_URL)
         assert response.headers["content-type"] == "application/json"
 
         # Test GET stats
-        response = await authenticated_client.get("/api/v1/users/me/stats")
+        response = await authenticated_client.get(USERS_ME_STATS_URL)
         assert response.headers["content-type"] == "application/json"
 
         # Test PATCH profile
-        response = await authenticated_client.patch(
-            "/api/v1/users/me", json={"name": "Test"}
-        )
+        response = await authenticated_client.patch(USERS_ME_URL, json={"name": "Test"})
         assert response.headers["content-type"] == "application/json"
 
     async def test_patch_profile_partial_update(
@@ -308,9 +258,7 @@ class TestUserRouter:
         update_data = {"name": "Only Name Updated"}
 
         # Act
-        response = await authenticated_client.patch(
-            "/api/v1/users/me", json=update_data
-        )
+        response = await authenticated_client.patch(USERS_ME_URL, json=update_data)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -326,7 +274,7 @@ class TestUserRouter:
         user_name = test_user.name
 
         # Act
-        response = await authenticated_client.patch("/api/v1/users/me", json={})
+        response = await authenticated_client.patch(USERS_ME_URL, json={})
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -344,9 +292,7 @@ class TestUserRouter:
         update_data = {"name": None, "profile_image_url": None}
 
         # Act
-        response = await authenticated_client.patch(
-            "/api/v1/users/me", json=update_data
-        )
+        response = await authenticated_client.patch(USERS_ME_URL, json=update_data)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -14,6 +14,12 @@ from workout_api.users.service import UserService
 # Mark all tests in this module as anyio tests
 pytestmark = pytest.mark.anyio
 
+# Validated once at import; the service only reads from update payloads
+UPDATE_PAYLOAD = UserProfileUpdate(
+    name="Updated Name", profile_image_url="https://example.com/new_profile.jpg"
+)
+EMPTY_UPDATE_PAYLOAD = UserProfileUpdate()
+
 
 @pytest.fixture
 async def user_service(session: AsyncSession):
@@ -57,29 +63,25 @@ class TestUserService:
             await user_service.get_user_profile(inactive_user.id)
 
     async def test_update_user_profile_success(
-        self, user_service: UserService, test_user: User
+        self, session: AsyncSession, user_service: UserService, test_user: User
     ):
-        """Test successful user profile update."""
+        """Test successful user profile update returns the updated profile."""
         # Arrange
         user_id = test_user.id
         original_email = test_user.email_address
-        update_data = UserProfileUpdate(
-            name="Updated Name", profile_image_url="https://example.com/new_profile.jpg"
-        )
 
         # Act
-        updated_user = await user_service.update_user_profile(user_id, update_data)
+        updated_user = await user_service.update_user_profile(user_id, UPDATE_PAYLOAD)
 
-        # Assert - Check the returned values directly from the update
-        assert updated_user is not None
-        # Note: We avoid accessing lazy-loaded attributes after session is closed
-        # Instead, we verify the update was successful by getting a fresh user
-        fresh_user = await user_service.get_user_profile(user_id)
-        assert fresh_user.name == "Updated Name"
+        # Assert - The UPDATE ... RETURNING row is already the updated profile
+        assert updated_user.id == user_id
+        assert updated_user.name == "Updated Name"
         assert (
-            str(fresh_user.profile_image_url) == "https://example.com/new_profile.jpg"
+            str(updated_user.profile_image_url) == "https://example.com/new_profile.jpg"
         )
-        assert fresh_user.email_address == original_email  # Unchanged
+        assert updated_user.email_address == original_email  # Unchanged
+        persisted_user = await session.get(User, user_id)
+        assert persisted_user.name == "Updated Name"
 
     async def test_update_user_profile_empty_data(
         self, user_service: UserService, test_user: User
@@ -88,10 +90,11 @@ class TestUserService:
         # Arrange
         user_id = test_user.id
         original_name = test_user.name
-        update_data = UserProfileUpdate()
 
         # Act
-        updated_user = await user_service.update_user_profile(user_id, update_data)
+        updated_user = await user_service.update_user_profile(
+            user_id, EMPTY_UPDATE_PAYLOAD
+        )
 
         # Assert
         assert updated_user is not None
@@ -99,11 +102,7 @@ class TestUserService:
         fresh_user = await user_service.get_user_profile(user_id)
         assert fresh_user.name == original_name  # Unchanged
 
-    async def test_update_user_profile_empty_name(
-        self,
-        user_service: UserService,  # noqa: ARG002
-        test_user: User,  # noqa: ARG002
-    ):
+    async def test_update_user_profile_empty_name(self):
         """Test user profile update with empty name."""
         # Act & Assert - Pydantic validation should catch this
         with pytest.raises(PydanticValidationError):
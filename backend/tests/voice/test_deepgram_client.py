@@ -14,6 +14,29 @@ from workout_api.voice.schemas import TranscriptionResponse
 # Mark all tests in this file as anyio tests
 pytestmark = pytest.mark.anyio
 
+API_KEY = "test_api_key"
+
+
+@pytest.fixture(scope="module")
+def shared_audio_file():
+    """Create a fake audio file shared by the module."""
+    return io.BytesIO(b"fake audio data for testing")
+
+
+@pytest.fixture
+def audio_file(shared_audio_file):
+    """Rewind the shared fake audio file before each use."""
+    shared_audio_file.seek(0)
+    return shared_audio_file
+
+
+@pytest.fixture(scope="module")
+def prod_client():
+    """Create one production client per module with the SDK constructor patched."""
+    with patch("workout_api.voice.deepgram_client.DeepgramClient") as mock_cls:
+        mock_cls.return_value = Mock()
+        yield ProductionDeepGramClient(API_KEY), mock_cls
+
 
 class TestMockDeepGramClient:
     """Test mock DeepGram client."""
@@ -23,44 +46,24 @@ class TestMockDeepGramClient:
         """Create mock DeepGram client."""
         return MockDeepGramClient()
 
-    @pytest.fixture
-    def audio_file(self):
-        """Create a fake audio file."""
-        return io.BytesIO(b"fake audio data for testing")
-
-    async def test_mock_transcription_returns_valid_response(
-        self, mock_client, audio_file
-    ):
-        """Test that mock client returns valid transcription response."""
-        response = await mock_client.transcribe_audio(audio_file)
+    @pytest.mark.parametrize(
+        "audio_data",
+        [b"small", b"much longer audio content", b"fake audio data for testing"],
+    )
+    async def test_mock_transcription(self, mock_client, audio_data):
+        """Test that mock client returns a valid, consistent response per audio."""
+        audio = io.BytesIO(audio_data)
 
-        assert isinstance(response, TranscriptionResponse)
-        assert response.transcribed_text in mock_client.mock_responses
-        assert response.confidence == 0.85
-        assert response.duration_seconds == 2.5
+        response1 = await mock_client.transcribe_audio(audio)
+        response2 = await mock_client.transcribe_audio(audio)
 
-    async def test_mock_transcription_consistency(self, mock_client, audio_file):
-        """Test that the same audio produces consistent results."""
-        response1 = await mock_client.transcribe_audio(audio_file)
-        response2 = await mock_client.transcribe_audio(audio_file)
+        assert isinstance(response1, TranscriptionResponse)
+        assert response1.transcribed_text in mock_client.mock_responses
+        assert response1.confidence == 0.85
+        assert response1.duration_seconds == 2.5
 
         # Should get the same result for the same audio data
-        assert response1.transcribed_text == response2.transcribed_text
-        assert response1.confidence == response2.confidence
-        assert response1.duration_seconds == response2.duration_seconds
-
-    async def test_mock_transcription_different_audio_sizes(self, mock_client):
-        """Test that different audio sizes produce different responses."""
-        audio_file_1 = io.BytesIO(b"small")
-        audio_file_2 = io.BytesIO(b"much longer audio content")
-
-        response1 = await mock_client.transcribe_audio(audio_file_1)
-        response2 = await mock_client.transcribe_audio(audio_file_2)
-
-        # Different sizes should potentially produce different responses
-        # (may be the same if hash collision, but test documents the behavior)
-        assert isinstance(response1, TranscriptionResponse)
-        assert isinstance(response2, TranscriptionResponse)
+        assert response2 == response1
 
     async def test_mock_transcription_resets_file_position(
         self, mock_client, audio_file
@@ -80,52 +83,26 @@ class TestMockDeepGramClient:
 class TestProductionDeepGramClient:
     """Test production DeepGram client."""
 
-    @pytest.fixture
-    def api_key(self):
-        """API key for testing."""
-        return "test_api_key"
-
-    @pytest.fixture
-    def mock_deepgram_client(self):
-        """Create a mock DeepGram client."""
-        return Mock()
-
-    @patch("workout_api.voice.deepgram_client.DeepgramClient")
-    def test_production_client_initialization(
-        self, mock_deepgram_client_class, api_key
-    ):
+    def test_production_client_initialization(self, prod_client):
         """Test production client initialization."""
-        # Mock the DeepgramClient constructor
-        mock_deepgram_client_class.return_value = Mock()
+        client, mock_deepgram_client_class = prod_client
 
-        client = ProductionDeepGramClient(api_key)
-        assert client.api_key == api_key
+        assert client.api_key == API_KEY
         assert client._client is not None
 
         # Verify the DeepgramClient was called with the API key
-        mock_deepgram_client_class.assert_called_once_with(api_key)
+        mock_deepgram_client_class.assert_called_once_with(API_KEY)
 
-    @patch("workout_api.voice.deepgram_client.DeepgramClient")
-    def test_production_client_interface_compliance(
-        self, mock_deepgram_client_class, api_key
-    ):
+    def test_production_client_interface_compliance(self, prod_client):
         """Test that production client implements the required interface."""
-        # Mock the DeepgramClient constructor
-        mock_deepgram_client_class.return_value = Mock()
-
-        client = ProductionDeepGramClient(api_key)
+        client, _ = prod_client
 
         # Check that the method exists and is callable
         assert hasattr(client, "transcribe_audio")
         assert callable(client.transcribe_audio)
 
-    @patch("workout_api.voice.deepgram_client.DeepgramClient")
-    def test_production_client_stores_api_key(
-        self, mock_deepgram_client_class, api_key
-    ):
+    def test_production_client_stores_api_key(self, prod_client):
         """Test that production client properly stores the API key."""
-        # Mock the DeepgramClient constructor
-        mock_deepgram_client_class.return_value = Mock()
+        client, _ = prod_client
 
-        client = ProductionDeepGramClient(api_key)
-        assert client.api_key == api_key
+        assert client.api_key == API_KEY
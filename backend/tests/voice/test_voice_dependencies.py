@@ -1,6 +1,7 @@
 """Test voice transcription dependencies."""
 
-from unittest.mock import Mock, patch
+from functools import lru_cache
+from unittest.mock import Mock
 
 import pytest
 
@@ -19,85 +20,63 @@ from workout_api.voice.service import VoiceTranscriptionService
 pytestmark = pytest.mark.anyio
 
 
-class TestDeepGramClientDependency:
-    """Test DeepGram client dependency factory."""
-
-    def test_development_environment_uses_mock_client(self):
-        """Test that development environment uses mock client."""
-        settings = Settings(
-            environment="development",
-            deepgram_api_key="test_key",
-            database_url="postgresql://test",
-            secret_key="test_secret_key_with_32_characters",
-        )
-
-        dependency_factory = get_deepgram_client_dependency()
-        client = dependency_factory(settings)
+@lru_cache
+def _settings(environment: str, deepgram_api_key: str) -> Settings:
+    """Build Settings once per (environment, API key) pair; tests only read them."""
+    return Settings(
+        environment=environment,
+        deepgram_api_key=deepgram_api_key,
+        database_url="postgresql://test",
+        secret_key="test_secret_key_with_32_characters",
+    )
 
-        assert isinstance(client, MockDeepGramClient)
 
-    @patch("workout_api.voice.deepgram_client.DeepgramClient")
-    def test_production_environment_with_api_key_uses_production_client(
-        self, mock_deepgram_client_class
-    ):
-        """Test that production environment with API key uses production client."""
-        # Mock the DeepgramClient constructor
-        mock_deepgram_client_class.return_value = Mock()
+@pytest.fixture
+def patch_deepgram(monkeypatch):
+    """Replace the DeepGram SDK client so production clients never hit the SDK."""
+    mock_cls = Mock(return_value=Mock())
+    monkeypatch.setattr("workout_api.voice.deepgram_client.DeepgramClient", mock_cls)
+    return mock_cls
 
-        settings = Settings(
-            environment="production",
-            deepgram_api_key="test_api_key",
-            database_url="postgresql://test",
-            secret_key="test_secret_key_with_32_characters",
-        )
-
-        dependency_factory = get_deepgram_client_dependency()
-        client = dependency_factory(settings)
-
-        assert isinstance(client, ProductionDeepGramClient)
-        assert client.api_key == "test_api_key"
-        # Verify the DeepgramClient was called with the API key
-        mock_deepgram_client_class.assert_called_once_with("test_api_key")
-
-    def test_production_environment_without_api_key_uses_mock_client(self):
-        """Test that production environment without API key uses mock client."""
-        settings = Settings(
-            environment="production",
-            deepgram_api_key="",  # Empty API key
-            database_url="postgresql://test",
-            secret_key="test_secret_key_with_32_characters",
-        )
-
-        dependency_factory = get_deepgram_client_dependency()
-        client = dependency_factory(settings)
 
-        assert isinstance(client, MockDeepGramClient)
+@pytest.mark.usefixtures("patch_deepgram")
+class TestDeepGramClientDependency:
+    """Test DeepGram client dependency factory."""
 
-    def test_test_environment_uses_mock_client(self):
-        """Test that test environment uses mock client."""
-        settings = Settings(
-            environment="test",
-            deepgram_api_key="test_key",
-            database_url="postgresql://test",
-            secret_key="test_secret_key_with_32_characters",
-        )
+    @pytest.mark.parametrize(
+        ("environment", "deepgram_api_key", "expected_client", "expected_api_key"),
+        [
+            ("development", "test_key", MockDeepGramClient, None),
+            ("production", "test_api_key", ProductionDeepGramClient, "test_api_key"),
+            ("production", "", MockDeepGramClient, None),  # Empty API key
+            # The test environment always uses the mock, even with an API key
+            ("test", "test_key", MockDeepGramClient, None),
+        ],
+    )
+    def test_client_selection(  # noqa: PLR0913
+        self,
+        patch_deepgram,
+        environment,
+        deepgram_api_key,
+        expected_client,
+        expected_api_key,
+    ):
+        """Test that the factory picks the client for environment and API key."""
+        settings = _settings(environment, deepgram_api_key)
 
         dependency_factory = get_deepgram_client_dependency()
         client = dependency_factory(settings)
 
-        # Test environment is not development, but no API key should still use mock
-        # Based on the logic: is_development OR not deepgram_api_key
-        assert isinstance(client, MockDeepGramClient)
-
-    def test_client_caching_behavior(self):
-        """Test that dependency factory is properly cached."""
-        factory1 = get_deepgram_client_dependency()
-        factory2 = get_deepgram_client_dependency()
-
-        # Should be the same function due to @lru_cache
-        assert factory1 is factory2
+        assert isinstance(client, expected_client)
+        if expected_api_key is None:
+            patch_deepgram.assert_not_called()
+        else:
+            assert client.api_key == expected_api_key
+            # Verify the DeepgramClient was called with the API key
+            patch_deepgram.assert_called_once_with(expected_api_key)
 
 
+@pytest.mark.usefixtures("patch_deepgram")
 class TestVoiceTranscriptionServiceDependency:
     """Test voice transcription service dependency factory."""
 
@@ -111,12 +90,8 @@ class TestVoiceTranscriptionServiceDependency:
         assert isinstance(service, VoiceTranscriptionService)
         assert service.deepgram_client == mock_client
 
-    @patch("workout_api.voice.deepgram_client.DeepgramClient")
-    def test_service_creation_with_production_client(self, mock_deepgram_client_class):
+    def test_service_creation_with_production_client(self):
         """Test service creation with production client."""
-        # Mock the DeepgramClient constructor
-        mock_deepgram_client_class.return_value = Mock()
-
         production_client = ProductionDeepGramClient("test_key")
 
         dependency_factory = get_voice_transcription_service_dependency()
@@ -125,14 +100,6 @@ class TestVoiceTranscriptionServiceDependency:
         assert isinstance(service, VoiceTranscriptionService)
         assert service.deepgram_client == production_client
 
-    def test_service_dependency_caching(self):
-        """Test that service dependency factory is properly cached."""
-        factory1 = get_voice_transcription_service_dependency()
-        factory2 = get_voice_transcription_service_dependency()
-
-        # Should be the same function due to @lru_cache
-        assert factory1 is factory2
-
     def test_service_with_mock_client_dependency(self):
         """Test service creation using mock client dependency."""
         mock_client = Mock()
@@ -144,17 +111,13 @@ class TestVoiceTranscriptionServiceDependency:
         assert service.deepgram_client == mock_client
 
 
+@pytest.mark.usefixtures("patch_deepgram")
 class TestDependencyIntegration:
     """Test full dependency integration."""
 
     def test_full_dependency_chain_development(self):
         """Test full dependency chain in development environment."""
-        settings = Settings(
-            environment="development",
-            deepgram_api_key="test_key",
-            database_url="postgresql://test",
-            secret_key="test_secret_key_with_32_characters",
-        )
+        settings = _settings("development", "test_key")
 
         # Create client
         client_factory = get_deepgram_client_dependency()
@@ -168,18 +131,9 @@ class TestDependencyIntegration:
         assert isinstance(service, VoiceTranscriptionService)
         assert service.deepgram_client == client
 
-    @patch("workout_api.voice.deepgram_client.DeepgramClient")
-    def test_full_dependency_chain_production(self, mock_deepgram_client_class):
+    def test_full_dependency_chain_production(self):
         """Test full dependency chain in production environment."""
-        # Mock the DeepgramClient constructor
-        mock_deepgram_client_class.return_value = Mock()
-
-        settings = Settings(
-            environment="production",
-            deepgram_api_key="prod_api_key",
-            database_url="postgresql://test",
-            secret_key="test_secret_key_with_32_characters",
-        )
+        settings = _settings("production", "prod_api_key")
 
         # Create client
         client_factory = get_deepgram_client_dependency()
@@ -193,3 +147,12 @@ class TestDependencyIntegration:
         assert client.api_key == "prod_api_key"
         assert isinstance(service, VoiceTranscriptionService)
         assert service.deepgram_client == client
+
+
+@pytest.mark.parametrize(
+    "factory_fn",
+    [get_deepgram_client_dependency, get_voice_transcription_service_dependency],
+)
+def test_dependency_factory_caching(factory_fn):
+    """Test that dependency factories are cached by @lru_cache."""
+    assert factory_fn() is factory_fn()
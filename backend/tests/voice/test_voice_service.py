@@ -7,6 +7,7 @@ import pytest
 
 from workout_api.voice.deepgram_client import (
     MockDeepGramClient,
+    ProductionDeepGramClient,
 )
 from workout_api.voice.schemas import TranscriptionResponse
 from workout_api.voice.service import VoiceTranscriptionService
@@ -14,6 +15,33 @@ from workout_api.voice.service import VoiceTranscriptionService
 # Mark all tests in this file as anyio tests
 pytestmark = pytest.mark.anyio
 
+EXPECTED_PHRASES = frozenset(
+    {
+        "Could probably go heavier next session",
+        "Felt strong today, good form",
+        "Lower back was tight, need to stretch more",
+        "Rest pause set, pushed through the burn",
+        "Form was sloppy on the last few reps",
+        "Great pump today, muscles felt activated",
+        "Need to focus on mind-muscle connection",
+        "Shoulders felt tight during the movement",
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def audio_file():
+    """Create a fake audio file shared by the module; clients rewind it on read."""
+    return io.BytesIO(b"fake audio data for testing")
+
+
+@pytest.fixture(scope="module")
+def deepgram_client_template():
+    """Build the spec'd DeepGram client mock once per module."""
+    template = Mock(spec=ProductionDeepGramClient)
+    template.transcribe_audio = AsyncMock()
+    return template
+
 
 class TestVoiceTranscriptionService:
     """Test voice transcription service with dependency injection."""
@@ -24,11 +52,10 @@ class TestVoiceTranscriptionService:
         return MockDeepGramClient()
 
     @pytest.fixture
-    def mock_deepgram_client(self):
-        """Create a mock DeepGram client for testing."""
-        mock_client = Mock()
-        mock_client.transcribe_audio = AsyncMock()
-        return mock_client
+    def mock_deepgram_client(self, deepgram_client_template):
+        """Reset the shared DeepGram client mock for this test."""
+        deepgram_client_template.reset_mock(return_value=True, side_effect=True)
+        return deepgram_client_template
 
     @pytest.fixture
     def service_with_mock_client(self, mock_client):
@@ -40,11 +67,6 @@ class TestVoiceTranscriptionService:
         """Create service with custom mock client."""
         return VoiceTranscriptionService(mock_deepgram_client)
 
-    @pytest.fixture
-    def audio_file(self):
-        """Create a fake audio file."""
-        return io.BytesIO(b"fake audio data for testing")
-
     async def test_service_initialization(self, mock_client):
         """Test service initialization with client dependency."""
         service = VoiceTranscriptionService(mock_client)
@@ -74,16 +96,7 @@ class TestVoiceTranscriptionService:
         result = await service_with_mock_client.transcribe_audio(audio_file)
 
         assert isinstance(result, TranscriptionResponse)
-        assert result.transcribed_text in [
-            "Could probably go heavier next session",
-            "Felt strong today, good form",
-            "Lower back was tight, need to stretch more",
-            "Rest pause set, pushed through the burn",
-            "Form was sloppy on the last few reps",
-            "Great pump today, muscles felt activated",
-            "Need to focus on mind-muscle connection",
-            "Shoulders felt tight during the movement",
-        ]
+        assert result.transcribed_text in EXPECTED_PHRASES
         assert result.confidence == 0.85
         assert result.duration_seconds == 2.5
 
@@ -113,11 +126,12 @@ class TestVoiceTranscriptionService:
         assert result1.confidence == result2.confidence
         assert result1.duration_seconds == result2.duration_seconds
 
-    async def test_service_with_production_client_interface(self, audio_file):
+    async def test_service_with_production_client_interface(
+        self, mock_deepgram_client, audio_file
+    ):
         """Test that service works with production client interface."""
-        # Create a mock that behaves like production client
-        mock_production_client = Mock()
-        mock_production_client.transcribe_audio = AsyncMock()
+        # The shared mock is spec'd against the production client
+        mock_production_client = mock_deepgram_client
         mock_production_client.transcribe_audio.return_value = TranscriptionResponse(
             transcribed_text="Production transcription",
             confidence=0.98,
@@ -1,79 +1,107 @@
 """Workout test fixtures and configuration."""
 
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
+from typing import Any
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from workout_api.exercises.models import Exercise, ExerciseModality
 from workout_api.users.models import User
+from workout_api.workouts.dependencies import (
+    get_workout_repository,
+    get_workout_service,
+)
 from workout_api.workouts.models import ExerciseExecution, Set, Workout
 from workout_api.workouts.repository import WorkoutRepository
 from workout_api.workouts.service import WorkoutService
 
-# Note: User fixtures (test_user, another_user, etc.) are now provided by main conftest.py
+# Note: test_user and another_user override the main conftest.py fixtures so the
+# workouts package reuses the seeded rows instead of inserting them per test
+
+
+SAMPLE_EXERCISE_DATA = {
+    "name": "Test Exercise",
+    "body_part": "Chest",
+    "modality": ExerciseModality.DUMBBELL,
+    "picture_url": "https://example.com/test.jpg",
+    "created_by_user_id": None,  # System exercise
+    "updated_by_user_id": None,
+    "is_user_created": False,
+}
+
+ANOTHER_EXERCISE_DATA = {
+    "name": "Another Exercise",
+    "body_part": "Back",
+    "modality": ExerciseModality.BARBELL,
+    "picture_url": "https://example.com/another.jpg",
+    "created_by_user_id": None,
+    "updated_by_user_id": None,
+    "is_user_created": False,
+}
+
+
+@pytest.fixture(scope="package")
+async def workout_seed(
+    db_connection: AsyncConnection,
+    test_user_data: dict[str, Any],
+    another_user_data: dict[str, Any],
+) -> AsyncGenerator[dict[str, int], None]:
+    """Insert the static users and exercises once per package.
+
+    The rows live in a package-level savepoint on the shared connection, so
+    every per-test savepoint sees them and rolling back the package savepoint
+    removes them again.
+    """
+    savepoint = await db_connection.begin_nested()
+
+    seed = {
+        "test_user": User(**test_user_data),
+        "another_user": User(**another_user_data),
+        "sample_exercise": Exercise(**SAMPLE_EXERCISE_DATA),
+        "another_exercise": Exercise(**ANOTHER_EXERCISE_DATA),
+    }
+    async with AsyncSession(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    ) as seed_session:
+        seed_session.add_all(seed.values())
+        await seed_session.flush()
+        seed_ids = {name: obj.id for name, obj in seed.items()}
+        await seed_session.commit()
+
+    try:
+        yield seed_ids
+    finally:
+        await savepoint.rollback()
 
 
 @pytest.fixture
-async def sample_exercise(session: AsyncSession) -> Exercise:
-    """Create a sample exercise for testing."""
-    exercise = Exercise(
-        name="Test Exercise",
-        body_part="Chest",
-        modality=ExerciseModality.DUMBBELL,
-        picture_url="https://example.com/test.jpg",
-        created_by_user_id=None,  # System exercise
-        updated_by_user_id=None,
-        is_user_created=False,
-    )
-    session.add(exercise)
-    await session.flush()
-    await session.refresh(exercise)
-    # Extract attributes early to prevent lazy loading issues
-    _ = (
-        exercise.id,
-        exercise.name,
-        exercise.body_part,
-        exercise.modality,
-        exercise.picture_url,
-        exercise.created_by_user_id,
-        exercise.updated_by_user_id,
-        exercise.is_user_created,
-        exercise.created_at,
-        exercise.updated_at,
-    )
-    return exercise
+async def test_user(session: AsyncSession, workout_seed: dict[str, int]) -> User:
+    """Load the seeded standard user into the test session."""
+    return await session.get(User, workout_seed["test_user"])
 
 
 @pytest.fixture
-async def another_exercise(session: AsyncSession) -> Exercise:
-    """Create another sample exercise for testing."""
-    exercise = Exercise(
-        name="Another Exercise",
-        body_part="Back",
-        modality=ExerciseModality.BARBELL,
-        picture_url="https://example.com/another.jpg",
-        created_by_user_id=None,
-        updated_by_user_id=None,
-        is_user_created=False,
-    )
-    session.add(exercise)
-    await session.flush()
-    await session.refresh(exercise)
-    # Extract attributes early
-    _ = (
-        exercise.id,
-        exercise.name,
-        exercise.body_part,
-        exercise.modality,
-        exercise.picture_url,
-        exercise.created_by_user_id,
-        exercise.updated_by_user_id,
-        exercise.is_user_created,
-        exercise.created_at,
-        exercise.updated_at,
-    )
-    return exercise
+async def another_user(session: AsyncSession, workout_seed: dict[str, int]) -> User:
+    """Load the seeded second user into the test session."""
+    return await session.get(User, workout_seed["another_user"])
+
+
+@pytest.fixture
+async def sample_exercise(
+    session: AsyncSession, workout_seed: dict[str, int]
+) -> Exercise:
+    """Load the seeded sample exercise into the test session."""
+    return await session.get(Exercise, workout_seed["sample_exercise"])
+
+
+@pytest.fixture
+async def another_exercise(
+    session: AsyncSession, workout_seed: dict[str, int]
+) -> Exercise:
+    """Load the seeded second exercise into the test session."""
+    return await session.get(Exercise, workout_seed["another_exercise"])
 
 
 @pytest.fixture
@@ -87,17 +115,7 @@ async def sample_workout(session: AsyncSession, test_user: User) -> Workout:
         finished_at=None,
     )
     session.add(workout)
-    await session.flush()
-    await session.refresh(workout)
-    # Extract attributes early to prevent lazy loading issues
-    _ = (
-        workout.id,
-        workout.finished_at,
-        workout.created_by_user_id,
-        workout.updated_by_user_id,
-        workout.created_at,
-        workout.updated_at,
-    )
+    await session.flush()  # id and timestamps come back via INSERT ... RETURNING
     return workout
 
 
@@ -112,20 +130,66 @@ async def finished_workout(session: AsyncSession, test_user: User) -> Workout:
         finished_at=datetime.now(UTC).replace(tzinfo=None),
     )
     session.add(workout)
-    await session.flush()
-    await session.refresh(workout)
-    # Extract attributes early
-    _ = (
-        workout.id,
-        workout.finished_at,
-        workout.created_by_user_id,
-        workout.updated_by_user_id,
-        workout.created_at,
-        workout.updated_at,
+    await session.flush()  # id and timestamps come back via INSERT ... RETURNING
+    return workout
+
+
+async def _add_execution_with_set(
+    session: AsyncSession, workout: Workout, exercise: Exercise
+) -> Workout:
+    """Add one exercise execution with one set (100 x 10) to ``workout``."""
+    workout_id = workout.id
+    exercise_id = exercise.id
+
+    session.add_all(
+        [
+            ExerciseExecution(
+                workout_id=workout_id,
+                exercise_id=exercise_id,
+                exercise_order=1,
+            ),
+            Set(
+                workout_id=workout_id,
+                exercise_id=exercise_id,
+                weight=100,
+                clean_reps=10,
+                forced_reps=0,
+            ),
+        ]
     )
+    await session.flush()
+
     return workout
 
 
+@pytest.fixture
+async def workout_with_exercise(
+    session: AsyncSession,
+    sample_workout: Workout,
+    sample_exercise: Exercise,
+) -> Workout:
+    """Create an in-progress workout holding one exercise execution with one set.
+
+    Inserted directly in the session so set tests do not pay for a
+    create_workout and an upsert call to reach that state.
+    """
+    return await _add_execution_with_set(session, sample_workout, sample_exercise)
+
+
+@pytest.fixture
+async def finished_workout_with_exercise(
+    session: AsyncSession,
+    finished_workout: Workout,
+    sample_exercise: Exercise,
+) -> Workout:
+    """Create a finished workout holding one exercise execution with one set.
+
+    Built directly in the session so tests of the finished-workout guards do
+    not need an upsert and a finish request to reach that state.
+    """
+    return await _add_execution_with_set(session, finished_workout, sample_exercise)
+
+
 @pytest.fixture
 async def workout_with_exercises(
     session: AsyncSession,
@@ -152,61 +216,41 @@ async def workout_with_exercises(
         exercise_order=2,
     )
 
-    session.add(execution1)
-    session.add(execution2)
-    await session.flush()
-    await session.refresh(execution1)
-    await session.refresh(execution2)
-
-    # Create sets for first exercise
-    sets1 = [
-        Set(
-            workout_id=workout_id,
-            exercise_id=sample_exercise_id,
-            weight=100,
-            clean_reps=10,
-            forced_reps=0,
-        ),
-        Set(
-            workout_id=workout_id,
-            exercise_id=sample_exercise_id,
-            weight=100,
-            clean_reps=8,
-            forced_reps=2,
-        ),
-    ]
-
-    # Create sets for second exercise
-    sets2 = [
-        Set(
-            workout_id=workout_id,
-            exercise_id=another_exercise_id,
-            weight=80,
-            clean_reps=12,
-            forced_reps=0,
-        ),
-    ]
-
-    for set_obj in sets1 + sets2:
-        session.add(set_obj)
+    # Stage executions and sets together; the unit of work inserts the
+    # executions before the sets that reference them, one executemany each
+    session.add_all(
+        [
+            execution1,
+            execution2,
+            # Sets for first exercise
+            Set(
+                workout_id=workout_id,
+                exercise_id=sample_exercise_id,
+                weight=100,
+                clean_reps=10,
+                forced_reps=0,
+            ),
+            Set(
+                workout_id=workout_id,
+                exercise_id=sample_exercise_id,
+                weight=100,
+                clean_reps=8,
+                forced_reps=2,
+            ),
+            # Sets for second exercise
+            Set(
+                workout_id=workout_id,
+                exercise_id=another_exercise_id,
+                weight=80,
+                clean_reps=12,
+                forced_reps=0,
+            ),
+        ]
+    )
 
+    # Single flush, no per-object refresh: ids and server-default timestamps
+    # come back via INSERT ... RETURNING
     await session.flush()
-    for set_obj in sets1 + sets2:
-        await session.refresh(set_obj)
-
-    # Extract set attributes early
-    for set_obj in sets1 + sets2:
-        _ = (
-            set_obj.id,
-            set_obj.workout_id,
-            set_obj.exercise_id,
-            set_obj.weight,
-            set_obj.clean_reps,
-            set_obj.forced_reps,
-            set_obj.note_text,
-            set_obj.created_at,
-            set_obj.updated_at,
-        )
 
     return workout
 
@@ -214,7 +258,7 @@ async def workout_with_exercises(
 @pytest.fixture
 def workout_repository(session: AsyncSession) -> WorkoutRepository:
     """Get workout repository for testing."""
-    return WorkoutRepository(session)
+    return get_workout_repository(session)
 
 
 @pytest.fixture
@@ -222,4 +266,4 @@ def workout_service(
     session: AsyncSession, workout_repository: WorkoutRepository
 ) -> WorkoutService:
     """Get workout service for testing."""
-    return WorkoutService(workout_repository, session)
+    return get_workout_service(workout_repository, session)
@@ -3,15 +3,18 @@
 from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from workout_api.exercises.models import Exercise
 from workout_api.shared.exceptions import NotFoundError, ValidationError
 from workout_api.users.models import User
-from workout_api.workouts.models import Workout
+from workout_api.workouts.models import ExerciseExecution, Set, Workout
 from workout_api.workouts.repository import WorkoutRepository
 from workout_api.workouts.schemas import (
     ExerciseExecutionRequest,
     ExerciseExecutionUpdate,
+    Page,
     Pagination,
     SetCreate,
     SetUpdate,
@@ -20,6 +23,14 @@ from workout_api.workouts.schemas import (
 
 pytestmark = pytest.mark.anyio
 
+DEFAULT_PAGINATION = Pagination(page=1, size=10)
+SIZE2_PAGINATION = Pagination(page=1, size=2)
+
+
+def _ids(page: "Page[Workout]") -> set[int]:
+    """Collect the workout IDs on a search page for membership assertions."""
+    return {w.id for w in page.items}
+
 
 class TestWorkoutRepository:
     """Test workout repository operations."""
@@ -69,15 +80,52 @@ class TestWorkoutRepository:
 
         assert result is None
 
-    async def test_get_by_id_not_found(
-        self, workout_repository: WorkoutRepository, test_user: User
+    @pytest.mark.parametrize(
+        ("method", "build_args", "expected"),
+        [
+            pytest.param("get_by_id", lambda _w, _e: (99999,), None, id="get_by_id"),
+            pytest.param(
+                "finish_workout", lambda _w, _e: (99999,), None, id="finish_workout"
+            ),
+            pytest.param("delete", lambda _w, _e: (99999,), False, id="delete"),
+            pytest.param(
+                "get_exercise_execution",
+                lambda w, e: (w, e),
+                None,
+                id="get_exercise_execution",
+            ),
+            pytest.param(
+                "delete_exercise_execution",
+                lambda w, e: (w, e),
+                False,
+                id="delete_exercise_execution",
+            ),
+            pytest.param(
+                "update_exercise_execution_metadata",
+                lambda w, e: (w, e, ExerciseExecutionUpdate(note_text="Test")),
+                None,
+                id="update_exercise_execution_metadata",
+            ),
+        ],
+    )
+    async def test_not_found(  # noqa: PLR0913
+        self,
+        workout_repository: WorkoutRepository,
+        sample_workout: Workout,
+        sample_exercise: Exercise,
+        test_user: User,
+        method: str,
+        build_args,
+        expected,
     ):
-        """Test getting non-existent workout returns None."""
-        user_id = test_user.id
+        """Test operations on missing records return None or False."""
+        # sample_workout has no exercise executions, so (workout, exercise)
+        # lookups miss as well as the 99999 IDs
+        args = build_args(sample_workout.id, sample_exercise.id)
 
-        result = await workout_repository.get_by_id(99999, user_id)
+        result = await getattr(workout_repository, method)(*args, test_user.id)
 
-        assert result is None
+        assert result is expected
 
     async def test_search_no_filters(
         self,
@@ -88,13 +136,12 @@ class TestWorkoutRepository:
         """Test searching workouts without filters."""
         user_id = test_user.id
         filters = WorkoutFilters()
-        pagination = Pagination(page=1, size=10)
 
-        page = await workout_repository.search(filters, pagination, user_id)
+        page = await workout_repository.search(filters, DEFAULT_PAGINATION, user_id)
 
         assert page.total >= 1
         assert len(page.items) >= 1
-        assert any(w.id == sample_workout.id for w in page.items)
+        assert sample_workout.id in _ids(page)
 
     async def test_search_with_finished_filter(
         self,
@@ -108,18 +155,19 @@ class TestWorkoutRepository:
 
         # Test unfinished workouts
         filters = WorkoutFilters(finished=False)
-        pagination = Pagination(page=1, size=10)
-        page = await workout_repository.search(filters, pagination, user_id)
+        page = await workout_repository.search(filters, DEFAULT_PAGINATION, user_id)
 
-        assert any(w.id == sample_workout.id for w in page.items)
-        assert not any(w.id == finished_workout.id for w in page.items)
+        ids = _ids(page)
+        assert sample_workout.id in ids
+        assert finished_workout.id not in ids
 
         # Test finished workouts
         filters = WorkoutFilters(finished=True)
-        page = await workout_repository.search(filters, pagination, user_id)
+        page = await workout_repository.search(filters, DEFAULT_PAGINATION, user_id)
 
-        assert not any(w.id == sample_workout.id for w in page.items)
-        assert any(w.id == finished_workout.id for w in page.items)
+        ids = _ids(page)
+        assert sample_workout.id not in ids
+        assert finished_workout.id in ids
 
     async def test_search_with_date_filters(
         self,
@@ -129,37 +177,43 @@ class TestWorkoutRepository:
     ):
         """Test searching workouts with date filters."""
         user_id = test_user.id
-
-        # Test start_date filter
-        start_date = datetime.now(UTC).replace(
+        # Naive UTC bounds of the current day, matching the stored timestamps
+        today_start = datetime.now(UTC).replace(
             tzinfo=None, hour=0, minute=0, second=0, microsecond=0
         )
-        filters = WorkoutFilters(start_date=start_date)
-        pagination = Pagination(page=1, size=10)
-        page = await workout_repository.search(filters, pagination, user_id)
+        today_end = today_start.replace(hour=23, minute=59, second=59)
+
+        # Test start_date filter
+        filters = WorkoutFilters(start_date=today_start)
+        page = await workout_repository.search(filters, DEFAULT_PAGINATION, user_id)
 
-        assert any(w.id == sample_workout.id for w in page.items)
+        assert sample_workout.id in _ids(page)
 
         # Test end_date filter (future date should include all)
-        end_date = datetime.now(UTC).replace(tzinfo=None, hour=23, minute=59, second=59)
-        filters = WorkoutFilters(end_date=end_date)
-        page = await workout_repository.search(filters, pagination, user_id)
+        filters = WorkoutFilters(end_date=today_end)
+        page = await workout_repository.search(filters, DEFAULT_PAGINATION, user_id)
 
-        assert any(w.id == sample_workout.id for w in page.items)
+        assert sample_workout.id in _ids(page)
 
     async def test_search_pagination(
-        self, workout_repository: WorkoutRepository, test_user: User
+        self,
+        workout_repository: WorkoutRepository,
+        session: AsyncSession,
+        test_user: User,
     ):
         """Test workout search pagination."""
         user_id = test_user.id
 
-        # Create multiple workouts
-        for _i in range(5):
-            await workout_repository.create(user_id)
+        # Create multiple workouts - one flush batches them into a single
+        # multi-row INSERT ... RETURNING
+        session.add_all(
+            Workout(created_by_user_id=user_id, updated_by_user_id=user_id)
+            for _ in range(5)
+        )
+        await session.flush()
 
         filters = WorkoutFilters()
-        pagination = Pagination(page=1, size=2)
-        page = await workout_repository.search(filters, pagination, user_id)
+        page = await workout_repository.search(filters, SIZE2_PAGINATION, user_id)
 
         assert page.total >= 5
         assert len(page.items) == 2
@@ -196,18 +250,9 @@ class TestWorkoutRepository:
         with pytest.raises(ValidationError, match="already finished"):
             await workout_repository.finish_workout(workout_id, user_id)
 
-    async def test_finish_workout_not_found(
-        self, workout_repository: WorkoutRepository, test_user: User
-    ):
-        """Test finishing non-existent workout returns None."""
-        user_id = test_user.id
-
-        result = await workout_repository.finish_workout(99999, user_id)
-
-        assert result is None
-
     async def test_delete_workout_success(
         self,
+        session: AsyncSession,
         workout_repository: WorkoutRepository,
         sample_workout: Workout,
         test_user: User,
@@ -219,19 +264,10 @@ class TestWorkoutRepository:
         result = await workout_repository.delete(workout_id, user_id)
 
         assert result is True
-        # Verify workout is deleted
-        deleted_workout = await workout_repository.get_by_id(workout_id, user_id)
-        assert deleted_workout is None
-
-    async def test_delete_workout_not_found(
-        self, workout_repository: WorkoutRepository, test_user: User
-    ):
-        """Test deleting non-existent workout returns False."""
-        user_id = test_user.id
-
-        result = await workout_repository.delete(99999, user_id)
-
-        assert result is False
+        remaining = await session.scalar(
+            select(func.count()).select_from(Workout).where(Workout.id == workout_id)
+        )
+        assert remaining == 0
 
     async def test_get_exercise_execution_success(
         self,
@@ -255,20 +291,20 @@ class TestWorkoutRepository:
         assert execution.exercise_id == exercise_id
         assert len(sets) == 2  # Two sets for the first exercise
 
-    async def test_get_exercise_execution_not_found(
+    async def test_get_exercise_execution_wrong_user(
         self,
         workout_repository: WorkoutRepository,
-        sample_workout: Workout,
+        workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,
+        another_user: User,
     ):
-        """Test getting non-existent exercise execution returns None."""
-        user_id = test_user.id
-        workout_id = sample_workout.id
+        """Test getting exercise execution with wrong user returns None."""
+        workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
+        wrong_user_id = another_user.id
 
         result = await workout_repository.get_exercise_execution(
-            workout_id, exercise_id, user_id
+            workout_id, exercise_id, wrong_user_id
         )
 
         assert result is None
@@ -384,6 +420,7 @@ class TestWorkoutRepository:
 
     async def test_delete_exercise_execution_success(
         self,
+        session: AsyncSession,
         workout_repository: WorkoutRepository,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
@@ -399,30 +436,15 @@ class TestWorkoutRepository:
         )
 
         assert result is True
-
-        # Verify execution is deleted
-        execution_result = await workout_repository.get_exercise_execution(
-            workout_id, exercise_id, user_id
-        )
-        assert execution_result is None
-
-    async def test_delete_exercise_execution_not_found(
-        self,
-        workout_repository: WorkoutRepository,
-        sample_workout: Workout,
-        sample_exercise: Exercise,
-        test_user: User,
-    ):
-        """Test deleting non-existent exercise execution returns False."""
-        user_id = test_user.id
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        result = await workout_repository.delete_exercise_execution(
-            workout_id, exercise_id, user_id
+        remaining = await session.scalar(
+            select(func.count())
+            .select_from(ExerciseExecution)
+            .where(
+                ExerciseExecution.workout_id == workout_id,
+                ExerciseExecution.exercise_id == exercise_id,
+            )
         )
-
-        assert result is False
+        assert remaining == 0
 
     async def test_create_set_success(
         self,
@@ -529,9 +551,10 @@ class TestWorkoutRepository:
 
         assert result is None
 
-    async def test_delete_set_success(
+    async def test_delete_set_success(  # noqa: PLR0913
         self,
         workout_repository: WorkoutRepository,
+        session: AsyncSession,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
         test_user: User,
@@ -540,14 +563,15 @@ class TestWorkoutRepository:
         user_id = test_user.id
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
-
-        # Get first set
-        result = await workout_repository.get_exercise_execution(
-            workout_id, exercise_id, user_id
+        initial_count = 2  # workout_with_exercises gives the first exercise two sets
+
+        # Get first set id without hydrating the execution and its sets
+        set_id = await session.scalar(
+            select(Set.id)
+            .where(Set.workout_id == workout_id, Set.exercise_id == exercise_id)
+            .order_by(Set.id)
+            .limit(1)
         )
-        _, sets = result
-        set_id = sets[0].id
-        initial_count = len(sets)
 
         delete_result = await workout_repository.delete_set(
             workout_id, exercise_id, set_id, user_id
@@ -606,26 +630,6 @@ class TestWorkoutRepository:
         assert updated_execution.note_text == "Updated metadata"
         assert updated_execution.exercise_order == 5
 
-    async def test_update_exercise_execution_metadata_not_found(
-        self,
-        workout_repository: WorkoutRepository,
-        sample_workout: Workout,
-        sample_exercise: Exercise,
-        test_user: User,
-    ):
-        """Test updating non-existent exercise execution metadata returns None."""
-        user_id = test_user.id
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        update_data = ExerciseExecutionUpdate(note_text="Test")
-
-        result = await workout_repository.update_exercise_execution_metadata(
-            workout_id, exercise_id, update_data, user_id
-        )
-
-        assert result is None
-
     async def test_reorder_exercise_executions_success(
         self,
         workout_repository: WorkoutRepository,
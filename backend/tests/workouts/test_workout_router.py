@@ -1,14 +1,82 @@
 """Test workout router endpoints integration."""
 
+import json
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from workout_api.exercises.models import Exercise
 from workout_api.users.models import User
-from workout_api.workouts.models import Workout
+from workout_api.workouts.models import ExerciseExecution, Set, Workout
 
 pytestmark = pytest.mark.anyio
 
+# Minimal valid upsert body, reused by tests that only vary the target
+UPSERT_BODY = {
+    "exercise_order": 1,
+    "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
+}
+# Pre-encoded once for tests that send UPSERT_BODY unchanged
+UPSERT_CONTENT = json.dumps(UPSERT_BODY).encode()
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Other bodies sent unchanged by several tests, pre-encoded once
+SET_CONTENT = json.dumps({"weight": 150.0, "clean_reps": 8, "forced_reps": 0}).encode()
+EXECUTION_PATCH_CONTENT = json.dumps({"exercise_order": 5}).encode()
+SET_PATCH_CONTENT = json.dumps({"weight": 175.0}).encode()
+# Auth user, workout check, exercise lookup, execution lookup, execution write,
+# set delete (update only), one set INSERT, exercise for the response; no
+# per-set reads
+MAX_UPSERT_QUERIES = 8
+# Authenticated user, workout, its executions and their sets (selectinload),
+# their exercises; independent of how many executions the workout has
+MAX_GET_WORKOUT_QUERIES = 5
+MISSING_ID = 999999
+
+
+def _workout_url(workout_id: int) -> str:
+    """Return the path of a single workout."""
+    return f"/api/v1/workouts/{workout_id}"
+
+
+def _finish_url(workout_id: int) -> str:
+    """Return the path that finishes a workout."""
+    return f"{_workout_url(workout_id)}/finish"
+
+
+def _reorder_url(workout_id: int) -> str:
+    """Return the path that reorders a workout's exercise executions."""
+    return f"{_workout_url(workout_id)}/exercise-executions/reorder"
+
+
+def _execution_url(workout_id: int, exercise_id: int) -> str:
+    """Return the path of one exercise execution in a workout."""
+    return f"{_workout_url(workout_id)}/exercise-executions/{exercise_id}"
+
+
+def _sets_url(workout_id: int, exercise_id: int) -> str:
+    """Return the path of an exercise execution's set collection."""
+    return f"{_execution_url(workout_id, exercise_id)}/sets"
+
+
+def _set_url(workout_id: int, exercise_id: int, set_id: int) -> str:
+    """Return the path of a single set."""
+    return f"{_sets_url(workout_id, exercise_id)}/{set_id}"
+
+
+async def _first_set_id(
+    session: AsyncSession, workout_id: int, exercise_id: int
+) -> int:
+    """Return the ID of the first set recorded for an exercise execution."""
+    return await session.scalar(
+        select(Set.id)
+        .where(Set.workout_id == workout_id, Set.exercise_id == exercise_id)
+        .order_by(Set.id)
+        .limit(1)
+    )
+
 
 class TestWorkoutRouter:
     """Test workout router endpoints with complete HTTP integration."""
@@ -26,34 +94,8 @@ class TestWorkoutRouter:
 
         response = await authenticated_client.post("/api/v1/workouts/")
 
-        assert response.status_code == 201
-        data = response.json()
-
-        assert data["id"] is not None
-        assert data["created_by_user_id"] == user_id
-        assert data["updated_by_user_id"] == user_id
-        assert data["finished_at"] is None
-        assert data["exercise_executions"] == []
-        assert "created_at" in data
-        assert "updated_at" in data
-
-    async def test_create_workout_without_auth(self, client: AsyncClient):
-        """Test creating workout without authentication returns 403."""
-        response = await client.post("/api/v1/workouts/")
-
-        assert response.status_code == 403
-
-    async def test_create_workout_response_format(
-        self,
-        authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test that create workout returns proper JSON structure."""
-        response = await authenticated_client.post("/api/v1/workouts/")
-
         assert response.status_code == 201
         assert response.headers["content-type"] == "application/json"
-
         data = response.json()
 
         # Verify all expected fields are present
@@ -68,90 +110,133 @@ class TestWorkoutRouter:
         }
         assert expected_fields.issubset(data.keys())
 
-        # Verify field types
         assert isinstance(data["id"], int)
-        assert isinstance(data["created_by_user_id"], int)
-        assert isinstance(data["updated_by_user_id"], int)
+        assert data["created_by_user_id"] == user_id
+        assert data["updated_by_user_id"] == user_id
         assert data["finished_at"] is None
-        assert isinstance(data["exercise_executions"], list)
+        assert data["exercise_executions"] == []
         assert isinstance(data["created_at"], str)
         assert isinstance(data["updated_at"], str)
 
+    async def test_create_workout_without_auth(self, client: AsyncClient):
+        """Test creating workout without authentication returns 403."""
+        response = await client.post("/api/v1/workouts/")
+
+        assert response.status_code == 403
+
     # =====================================
     # upsert_exercise_execution tests
     # =====================================
 
-    async def test_upsert_exercise_execution_create_success(
+    @pytest.mark.parametrize(
+        ("note_text", "sets"),
+        [
+            pytest.param(
+                "First exercise of the day",
+                [
+                    {"weight": 100.0, "clean_reps": 10, "forced_reps": 0},
+                    {
+                        "weight": 100.0,
+                        "clean_reps": 8,
+                        "forced_reps": 2,
+                        "note_text": "Tough set",
+                    },
+                ],
+                id="with_sets",
+            ),
+            pytest.param("Exercise with no sets yet", [], id="empty_sets"),
+        ],
+    )
+    async def test_upsert_exercise_execution_create_success(  # noqa: PLR0913
         self,
         authenticated_client: AsyncClient,
+        session: AsyncSession,
         sample_workout: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        query_counter: list[str],
+        note_text: str,
+        sets: list[dict[str, Any]],
     ):
-        """Test creating new exercise execution via HTTP."""
+        """Test creating new exercise execution via HTTP, with and without sets."""
         # Extract IDs early to avoid lazy loading issues
         workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
         request_data = {
             "exercise_order": 1,
-            "note_text": "First exercise of the day",
-            "sets": [
-                {"weight": 100.0, "clean_reps": 10, "forced_reps": 0},
-                {
-                    "weight": 100.0,
-                    "clean_reps": 8,
-                    "forced_reps": 2,
-                    "note_text": "Tough set",
-                },
-            ],
+            "note_text": note_text,
+            "sets": sets,
         }
 
+        query_counter.clear()
+        # Start cold like a production request; fixtures keep rows in the session
+        session.expunge_all()
         response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
+            _execution_url(workout_id, exercise_id),
             json=request_data,
         )
 
         assert response.status_code == 200
+        assert len(query_counter) <= MAX_UPSERT_QUERIES, query_counter
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
 
+        # Verify exercise execution fields
+        execution_expected_fields = {
+            "exercise_id",
+            "exercise_name",
+            "exercise_order",
+            "note_text",
+            "sets",
+            "created_at",
+            "updated_at",
+        }
+        assert execution_expected_fields.issubset(data.keys())
+
         assert data["exercise_id"] == exercise_id
         assert data["exercise_name"] == "Test Exercise"  # From fixture
         assert data["exercise_order"] == 1
-        assert data["note_text"] == "First exercise of the day"
-        assert len(data["sets"]) == 2
-
-        # Verify sets
-        assert data["sets"][0]["weight"] == 100.0
-        assert data["sets"][0]["clean_reps"] == 10
-        assert data["sets"][0]["forced_reps"] == 0
-        assert data["sets"][0]["note_text"] is None
-
-        assert data["sets"][1]["weight"] == 100.0
-        assert data["sets"][1]["clean_reps"] == 8
-        assert data["sets"][1]["forced_reps"] == 2
-        assert data["sets"][1]["note_text"] == "Tough set"
+        assert data["note_text"] == note_text
+        assert isinstance(data["created_at"], str)
+        assert isinstance(data["updated_at"], str)
+        assert len(data["sets"]) == len(sets)
 
-    async def test_upsert_exercise_execution_update_success(
+        # Verify set structure
+        set_expected_fields = {
+            "id",
+            "weight",
+            "clean_reps",
+            "forced_reps",
+            "note_text",
+            "created_at",
+            "updated_at",
+        }
+        for set_data in data["sets"]:
+            assert set_expected_fields.issubset(set_data.keys())
+            assert isinstance(set_data["id"], int)
+            assert isinstance(set_data["created_at"], str)
+            assert isinstance(set_data["updated_at"], str)
+
+        # Verify sets come back in request order with the submitted values
+        for set_data, sent in zip(data["sets"], sets, strict=True):
+            assert set_data["weight"] == sent["weight"]
+            assert set_data["clean_reps"] == sent["clean_reps"]
+            assert set_data["forced_reps"] == sent["forced_reps"]
+            assert set_data["note_text"] == sent.get("note_text")
+
+    async def test_upsert_exercise_execution_update_success(  # noqa: PLR0913
         self,
         authenticated_client: AsyncClient,
+        session: AsyncSession,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        query_counter: list[str],
     ):
         """Test updating existing exercise execution via HTTP."""
         # Extract IDs early
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        # Get initial state to verify it exists
-        get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
-        assert get_response.status_code == 200
-        initial_data = get_response.json()
-        assert len(initial_data["sets"]) == 2  # From fixture
-
         # Update with different sets (complete replacement)
         request_data = {
             "exercise_order": 3,
@@ -163,12 +248,16 @@ class TestWorkoutRouter:
             ],
         }
 
+        query_counter.clear()
+        # Start cold like a production request; fixtures keep rows in the session
+        session.expunge_all()
         response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
+            _execution_url(workout_id, exercise_id),
             json=request_data,
         )
 
         assert response.status_code == 200
+        assert len(query_counter) <= MAX_UPSERT_QUERIES, query_counter
         data = response.json()
 
         assert data["exercise_id"] == exercise_id
@@ -189,177 +278,94 @@ class TestWorkoutRouter:
         workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        request_data = {
-            "exercise_order": 1,
-            "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-        }
-
         response = await client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=request_data,
+            _execution_url(workout_id, exercise_id),
+            content=UPSERT_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 403
 
-    async def test_upsert_exercise_execution_invalid_workout_404(
-        self,
-        authenticated_client: AsyncClient,
-        sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test upsert with non-existent workout returns 404."""
-        # Extract ID early
-        exercise_id = sample_exercise.id
-
-        request_data = {
-            "exercise_order": 1,
-            "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-        }
-
-        response = await authenticated_client.put(
-            f"/api/v1/workouts/999999/exercise-executions/{exercise_id}",
-            json=request_data,
-        )
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    async def test_upsert_exercise_execution_invalid_exercise_404(
-        self,
-        authenticated_client: AsyncClient,
-        sample_workout: Workout,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test upsert with non-existent exercise returns 404."""
-        # Extract ID early
-        workout_id = sample_workout.id
-
-        request_data = {
-            "exercise_order": 1,
-            "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-        }
-
-        response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/999999",
-            json=request_data,
-        )
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    async def test_upsert_exercise_execution_validation_error(
-        self,
-        authenticated_client: AsyncClient,
-        sample_workout: Workout,
-        sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test upsert with invalid data returns 422."""
-        # Extract IDs early
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        # Invalid data - negative reps
-        request_data = {
-            "exercise_order": 1,
-            "sets": [
+    @pytest.mark.parametrize(
+        ("missing", "request_kwargs", "expected_status"),
+        [
+            pytest.param(
+                "workout",
+                {"content": UPSERT_CONTENT, "headers": JSON_HEADERS},
+                404,
+                id="invalid_workout",
+            ),
+            pytest.param(
+                "exercise",
+                {"content": UPSERT_CONTENT, "headers": JSON_HEADERS},
+                404,
+                id="invalid_exercise",
+            ),
+            pytest.param(
+                None,
                 {
-                    "weight": -100.0,  # Invalid negative weight
-                    "clean_reps": -5,  # Invalid negative reps
-                    "forced_reps": 0,
-                }
-            ],
-        }
-
-        response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=request_data,
-        )
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-
-    async def test_upsert_exercise_execution_empty_sets(
+                    "json": {
+                        **UPSERT_BODY,
+                        "sets": [
+                            {
+                                "weight": -100.0,  # Invalid negative weight
+                                "clean_reps": -5,  # Invalid negative reps
+                                "forced_reps": 0,
+                            }
+                        ],
+                    }
+                },
+                422,
+                id="validation_error",
+            ),
+            pytest.param(
+                None,
+                # exercise_order is missing
+                {"json": {"sets": UPSERT_BODY["sets"]}},
+                422,
+                id="missing_required_fields",
+            ),
+        ],
+    )
+    async def test_upsert_exercise_execution_errors(  # noqa: PLR0913
         self,
         authenticated_client: AsyncClient,
         sample_workout: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        missing: str | None,
+        request_kwargs: dict[str, Any],
+        expected_status: int,
     ):
-        """Test upsert with empty sets array."""
+        """Test upsert with unknown IDs returns 404 and invalid bodies return 422."""
         # Extract IDs early
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        request_data = {
-            "exercise_order": 1,
-            "note_text": "Exercise with no sets yet",
-            "sets": [],  # Empty sets
-        }
+        workout_id = MISSING_ID if missing == "workout" else sample_workout.id
+        exercise_id = MISSING_ID if missing == "exercise" else sample_exercise.id
 
         response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=request_data,
+            _execution_url(workout_id, exercise_id),
+            **request_kwargs,
         )
 
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["exercise_id"] == exercise_id
-        assert data["exercise_order"] == 1
-        assert data["note_text"] == "Exercise with no sets yet"
-        assert data["sets"] == []
+        assert response.status_code == expected_status
+        if expected_status == 404:
+            assert "not found" in response.json()["detail"].lower()
+        elif expected_status == 422:
+            assert "detail" in response.json()
 
     async def test_upsert_exercise_execution_malformed_json(
-        self,
-        authenticated_client: AsyncClient,
-        sample_workout: Workout,
-        sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        self, http_client: AsyncClient
     ):
-        """Test upsert with malformed JSON returns 422."""
-        # Extract IDs early
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        # Send malformed JSON
-        response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
+        """Test upsert with malformed JSON returns 422 without touching the DB."""
+        # The body is decoded before any dependency runs, so neither a session
+        # nor an authenticated user (nor existing rows) is needed
+        response = await http_client.put(
+            _execution_url(MISSING_ID, MISSING_ID),
             content='{"invalid": json}',  # Malformed JSON
-            headers={"Content-Type": "application/json"},
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 422
-
-    async def test_upsert_exercise_execution_missing_required_fields(
-        self,
-        authenticated_client: AsyncClient,
-        sample_workout: Workout,
-        sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test upsert with missing required fields returns 422."""
-        # Extract IDs early
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        # Missing required exercise_order field
-        request_data = {
-            "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-            # exercise_order is missing
-        }
-
-        response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=request_data,
-        )
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
+        assert response.json()["detail"][0]["type"] == "json_invalid"
 
     async def test_upsert_exercise_execution_user_ownership(
         self,
@@ -372,15 +378,11 @@ class TestWorkoutRouter:
         workout_id = sample_workout.id  # Owned by test_user
         exercise_id = sample_exercise.id
 
-        request_data = {
-            "exercise_order": 1,
-            "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-        }
-
         # another_authenticated_client is authenticated as another_user
         response = await another_authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=request_data,
+            _execution_url(workout_id, exercise_id),
+            content=UPSERT_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         # Should return 404 (not 403) because the workout doesn't exist for this user
@@ -388,83 +390,6 @@ class TestWorkoutRouter:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    async def test_upsert_exercise_execution_response_format(
-        self,
-        authenticated_client: AsyncClient,
-        sample_workout: Workout,
-        sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test that upsert returns proper JSON structure."""
-        # Extract IDs early
-        workout_id = sample_workout.id
-        exercise_id = sample_exercise.id
-
-        request_data = {
-            "exercise_order": 1,
-            "note_text": "Test notes",
-            "sets": [
-                {
-                    "weight": 100.0,
-                    "clean_reps": 10,
-                    "forced_reps": 0,
-                    "note_text": "Set notes",
-                }
-            ],
-        }
-
-        response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=request_data,
-        )
-
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/json"
-
-        data = response.json()
-
-        # Verify exercise execution fields
-        execution_expected_fields = {
-            "exercise_id",
-            "exercise_name",
-            "exercise_order",
-            "note_text",
-            "sets",
-            "created_at",
-            "updated_at",
-        }
-        assert execution_expected_fields.issubset(data.keys())
-
-        # Verify field types
-        assert isinstance(data["exercise_id"], int)
-        assert isinstance(data["exercise_name"], str)
-        assert isinstance(data["exercise_order"], int)
-        assert isinstance(data["sets"], list)
-        assert isinstance(data["created_at"], str)
-        assert isinstance(data["updated_at"], str)
-
-        # Verify set structure
-        assert len(data["sets"]) == 1
-        set_data = data["sets"][0]
-        set_expected_fields = {
-            "id",
-            "weight",
-            "clean_reps",
-            "forced_reps",
-            "note_text",
-            "created_at",
-            "updated_at",
-        }
-        assert set_expected_fields.issubset(set_data.keys())
-
-        # Verify set field types
-        assert isinstance(set_data["id"], int)
-        assert isinstance(set_data["weight"], int | float)
-        assert isinstance(set_data["clean_reps"], int)
-        assert isinstance(set_data["forced_reps"], int)
-        assert isinstance(set_data["created_at"], str)
-        assert isinstance(set_data["updated_at"], str)
-
     # ===================
     # list_workouts tests
     # ===================
@@ -472,75 +397,69 @@ class TestWorkoutRouter:
     async def test_list_workouts_success_no_filters(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
+        sample_workout: Workout,
     ):
-        """Test successful workout listing with no filters."""
+        """Test successful workout listing with no filters and its JSON format."""
+        workout_id = sample_workout.id
+
         response = await authenticated_client.get("/api/v1/workouts/")
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
 
         # Verify pagination structure
-        assert "items" in data
-        assert "page" in data
-        assert "size" in data
-        assert "total" in data
-        assert "pages" in data
+        pagination_fields = {"items", "page", "size", "total", "pages"}
+        assert pagination_fields.issubset(data.keys())
 
         assert isinstance(data["items"], list)
         assert data["page"] == 1
         assert data["size"] == 20  # Default size
 
-    async def test_list_workouts_with_pagination(
-        self,
-        authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test workout listing with custom pagination."""
-        response = await authenticated_client.get("/api/v1/workouts/?page=1&size=5")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        assert data["page"] == 1
-        assert data["size"] == 5
-
-    async def test_list_workouts_with_date_filters(
-        self,
-        authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test workout listing with date filters."""
-        response = await authenticated_client.get(
-            "/api/v1/workouts/?start_date=2024-01-01T00:00:00Z&end_date=2024-12-31T23:59:59Z"
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "items" in data
-
-    async def test_list_workouts_with_finished_filter(
+        # Verify workout structure
+        workout_data = next(w for w in data["items"] if w["id"] == workout_id)
+        workout_expected_fields = {
+            "id",
+            "created_by_user_id",
+            "updated_by_user_id",
+            "finished_at",
+            "exercise_executions",
+            "created_at",
+            "updated_at",
+        }
+        assert workout_expected_fields.issubset(workout_data.keys())
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            pytest.param("?page=1&size=5", {"page": 1, "size": 5}, id="pagination"),
+            pytest.param(
+                "?start_date=2024-01-01T00:00:00Z&end_date=2024-12-31T23:59:59Z",
+                {"page": 1, "size": 20},
+                id="date_filters",
+            ),
+            pytest.param("?finished=true", {"page": 1, "size": 20}, id="finished"),
+            pytest.param("?finished=false", {"page": 1, "size": 20}, id="active"),
+        ],
+    )
+    async def test_list_workouts_with_query_params(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
+        query: str,
+        expected: dict[str, int],
     ):
-        """Test workout listing with finished filter."""
-        response = await authenticated_client.get("/api/v1/workouts/?finished=true")
+        """Test workout listing with pagination and filter query parameters."""
+        response = await authenticated_client.get(f"/api/v1/workouts/{query}")
 
         assert response.status_code == 200
         data = response.json()
-        assert "items" in data
-
-        response = await authenticated_client.get("/api/v1/workouts/?finished=false")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "items" in data
+        assert isinstance(data["items"], list)
+        assert {key: data[key] for key in expected} == expected
 
     async def test_list_workouts_invalid_date_format(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test workout listing with invalid date format returns 422."""
         response = await authenticated_client.get(
@@ -557,38 +476,6 @@ class TestWorkoutRouter:
 
         assert response.status_code == 403
 
-    async def test_list_workouts_response_format(
-        self,
-        authenticated_client: AsyncClient,
-        sample_workout: Workout,  # noqa: ARG002
-        test_user: User,  # noqa: ARG002
-    ):
-        """Test that list workouts returns proper JSON structure."""
-        response = await authenticated_client.get("/api/v1/workouts/")
-
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/json"
-
-        data = response.json()
-
-        # Verify pagination fields
-        pagination_fields = {"items", "page", "size", "total", "pages"}
-        assert pagination_fields.issubset(data.keys())
-
-        # If there are items, verify workout structure
-        if data["items"]:
-            workout_data = data["items"][0]
-            workout_expected_fields = {
-                "id",
-                "created_by_user_id",
-                "updated_by_user_id",
-                "finished_at",
-                "exercise_executions",
-                "created_at",
-                "updated_at",
-            }
-            assert workout_expected_fields.issubset(workout_data.keys())
-
     # ==================
     # get_workout tests
     # ==================
@@ -597,12 +484,11 @@ class TestWorkoutRouter:
         self,
         authenticated_client: AsyncClient,
         sample_workout: Workout,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successful retrieval of a single workout."""
         workout_id = sample_workout.id
 
-        response = await authenticated_client.get(f"/api/v1/workouts/{workout_id}")
+        response = await authenticated_client.get(_workout_url(workout_id))
 
         assert response.status_code == 200
         data = response.json()
@@ -617,10 +503,9 @@ class TestWorkoutRouter:
     async def test_get_workout_not_found(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test getting non-existent workout returns 404."""
-        response = await authenticated_client.get("/api/v1/workouts/99999")
+        response = await authenticated_client.get(_workout_url(99999))
 
         assert response.status_code == 404
         data = response.json()
@@ -634,9 +519,7 @@ class TestWorkoutRouter:
         """Test that get workout respects user ownership."""
         workout_id = sample_workout.id
 
-        response = await another_authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}"
-        )
+        response = await another_authenticated_client.get(_workout_url(workout_id))
 
         assert response.status_code == 404
         data = response.json()
@@ -648,22 +531,27 @@ class TestWorkoutRouter:
         """Test getting workout without authentication returns 403."""
         workout_id = sample_workout.id
 
-        response = await client.get(f"/api/v1/workouts/{workout_id}")
+        response = await client.get(_workout_url(workout_id))
 
         assert response.status_code == 403
 
     async def test_get_workout_with_exercises(
         self,
         authenticated_client: AsyncClient,
+        session: AsyncSession,
         workout_with_exercises: Workout,
-        test_user: User,  # noqa: ARG002
+        query_counter: list[str],
     ):
         """Test getting workout with exercise executions."""
         workout_id = workout_with_exercises.id
 
-        response = await authenticated_client.get(f"/api/v1/workouts/{workout_id}")
+        query_counter.clear()
+        # Start cold like a production request; fixtures keep rows in the session
+        session.expunge_all()
+        response = await authenticated_client.get(_workout_url(workout_id))
 
         assert response.status_code == 200
+        assert len(query_counter) <= MAX_GET_WORKOUT_QUERIES, query_counter
         data = response.json()
 
         assert data["id"] == workout_id
@@ -688,14 +576,11 @@ class TestWorkoutRouter:
         self,
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successfully finishing an active workout with exercises."""
         workout_id = workout_with_exercises.id
 
-        response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/finish"
-        )
+        response = await authenticated_client.patch(_finish_url(workout_id))
 
         assert response.status_code == 200
         data = response.json()
@@ -713,10 +598,9 @@ class TestWorkoutRouter:
     async def test_finish_workout_not_found(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test finishing non-existent workout returns 404."""
-        response = await authenticated_client.patch("/api/v1/workouts/99999/finish")
+        response = await authenticated_client.patch(_finish_url(99999))
 
         assert response.status_code == 404
         data = response.json()
@@ -726,14 +610,11 @@ class TestWorkoutRouter:
         self,
         authenticated_client: AsyncClient,
         finished_workout: Workout,
-        test_user: User,  # noqa: ARG002
     ):
         """Test finishing already finished workout returns 400."""
         workout_id = finished_workout.id
 
-        response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/finish"
-        )
+        response = await authenticated_client.patch(_finish_url(workout_id))
 
         assert response.status_code == 400
         data = response.json()
@@ -747,9 +628,7 @@ class TestWorkoutRouter:
         """Test that finish workout respects user ownership."""
         workout_id = sample_workout.id
 
-        response = await another_authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/finish"
-        )
+        response = await another_authenticated_client.patch(_finish_url(workout_id))
 
         assert response.status_code == 404
         data = response.json()
@@ -761,14 +640,13 @@ class TestWorkoutRouter:
         """Test finishing workout without authentication returns 403."""
         workout_id = sample_workout.id
 
-        response = await client.patch(f"/api/v1/workouts/{workout_id}/finish")
+        response = await client.patch(_finish_url(workout_id))
 
         assert response.status_code == 403
 
     async def test_finish_empty_workout_deletes_it(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test finishing empty workout (no exercises) deletes it instead of finishing."""
         # Create empty workout
@@ -781,9 +659,7 @@ class TestWorkoutRouter:
         assert workout_data["exercise_executions"] == []
 
         # Finish the empty workout
-        response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/finish"
-        )
+        response = await authenticated_client.patch(_finish_url(workout_id))
 
         assert response.status_code == 200
         data = response.json()
@@ -795,13 +671,12 @@ class TestWorkoutRouter:
         assert data["workout"] is None  # No workout data returned
 
         # Verify workout no longer exists
-        get_response = await authenticated_client.get(f"/api/v1/workouts/{workout_id}")
+        get_response = await authenticated_client.get(_workout_url(workout_id))
         assert get_response.status_code == 404
 
     async def test_finish_non_empty_workout_finishes_normally(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
         sample_exercise: Exercise,
     ):
         """Test finishing non-empty workout (with exercises) finishes it normally."""
@@ -820,15 +695,13 @@ class TestWorkoutRouter:
             "sets": [],  # Empty sets still counts as non-empty workout
         }
         upsert_response = await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
+            _execution_url(workout_id, exercise_id),
             json=exercise_data,
         )
         assert upsert_response.status_code == 200
 
         # Finish the non-empty workout
-        response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/finish"
-        )
+        response = await authenticated_client.patch(_finish_url(workout_id))
 
         assert response.status_code == 200
         data = response.json()
@@ -842,7 +715,7 @@ class TestWorkoutRouter:
         assert data["workout"]["finished_at"] is not None
 
         # Verify workout still exists and is finished
-        get_response = await authenticated_client.get(f"/api/v1/workouts/{workout_id}")
+        get_response = await authenticated_client.get(_workout_url(workout_id))
         assert get_response.status_code == 200
         finished_workout = get_response.json()
         assert finished_workout["finished_at"] is not None
@@ -855,28 +728,26 @@ class TestWorkoutRouter:
         self,
         authenticated_client: AsyncClient,
         sample_workout: Workout,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test successfully deleting a workout."""
         # Extract workout_id early to avoid lazy loading
         workout_id = sample_workout.id
 
-        response = await authenticated_client.delete(f"/api/v1/workouts/{workout_id}")
+        response = await authenticated_client.delete(_workout_url(workout_id))
 
         assert response.status_code == 204
         assert response.content == b""
 
-        # Verify workout is deleted by trying to get it
-        get_response = await authenticated_client.get(f"/api/v1/workouts/{workout_id}")
-        assert get_response.status_code == 404
+        # Verify the row is gone straight from the session, without a GET
+        assert await session.get(Workout, workout_id) is None
 
     async def test_delete_workout_not_found(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test deleting non-existent workout returns 404."""
-        response = await authenticated_client.delete("/api/v1/workouts/99999")
+        response = await authenticated_client.delete(_workout_url(99999))
 
         assert response.status_code == 404
         data = response.json()
@@ -890,9 +761,7 @@ class TestWorkoutRouter:
         """Test that delete workout respects user ownership."""
         workout_id = sample_workout.id
 
-        response = await another_authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}"
-        )
+        response = await another_authenticated_client.delete(_workout_url(workout_id))
 
         assert response.status_code == 404
         data = response.json()
@@ -904,7 +773,7 @@ class TestWorkoutRouter:
         """Test deleting workout without authentication returns 403."""
         workout_id = sample_workout.id
 
-        response = await client.delete(f"/api/v1/workouts/{workout_id}")
+        response = await client.delete(_workout_url(workout_id))
 
         assert response.status_code == 403
 
@@ -912,19 +781,26 @@ class TestWorkoutRouter:
         self,
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test deleting workout with exercise executions and sets."""
         # Extract workout_id early to avoid lazy loading issues
         workout_id = workout_with_exercises.id
 
-        response = await authenticated_client.delete(f"/api/v1/workouts/{workout_id}")
+        response = await authenticated_client.delete(_workout_url(workout_id))
 
         assert response.status_code == 204
 
         # Verify workout and related data is deleted
-        get_response = await authenticated_client.get(f"/api/v1/workouts/{workout_id}")
-        assert get_response.status_code == 404
+        assert await session.get(Workout, workout_id) is None
+        assert not await session.scalar(
+            select(ExerciseExecution.id)
+            .where(ExerciseExecution.workout_id == workout_id)
+            .limit(1)
+        )
+        assert not await session.scalar(
+            select(Set.id).where(Set.workout_id == workout_id).limit(1)
+        )
 
     # ==============================
     # get_exercise_execution tests
@@ -935,14 +811,13 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successfully getting exercise execution with sets."""
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
         response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 200
@@ -959,14 +834,13 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         sample_workout: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test getting non-existent exercise execution returns 404."""
         workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
         response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 404
@@ -984,7 +858,7 @@ class TestWorkoutRouter:
         exercise_id = sample_exercise.id
 
         response = await another_authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 404
@@ -1001,9 +875,7 @@ class TestWorkoutRouter:
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        response = await client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
+        response = await client.get(_execution_url(workout_id, exercise_id))
 
         assert response.status_code == 403
 
@@ -1016,7 +888,6 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successfully deleting exercise execution."""
         # Extract IDs early to avoid lazy loading issues
@@ -1024,7 +895,7 @@ class TestWorkoutRouter:
         exercise_id = sample_exercise.id
 
         response = await authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 204
@@ -1032,7 +903,7 @@ class TestWorkoutRouter:
 
         # Verify exercise execution is deleted
         get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
         assert get_response.status_code == 404
 
@@ -1041,14 +912,13 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         sample_workout: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test deleting non-existent exercise execution returns 404."""
         workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
         response = await authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 404
@@ -1058,26 +928,16 @@ class TestWorkoutRouter:
     async def test_delete_exercise_execution_finished_workout(
         self,
         authenticated_client: AsyncClient,
-        sample_workout: Workout,
+        finished_workout_with_exercise: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test deleting exercise execution from finished workout returns 400."""
-        workout_id = sample_workout.id
+        workout_id = finished_workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # First add an exercise execution to the active workout
-        await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json={"exercise_order": 1, "sets": []},
-        )
-
-        # Finish the workout
-        await authenticated_client.patch(f"/api/v1/workouts/{workout_id}/finish")
-
         # Now try to delete exercise execution from finished workout
         response = await authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 400
@@ -1095,7 +955,7 @@ class TestWorkoutRouter:
         exercise_id = sample_exercise.id
 
         response = await another_authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
 
         assert response.status_code == 404
@@ -1111,7 +971,6 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successfully updating exercise execution metadata."""
         workout_id = workout_with_exercises.id
@@ -1123,7 +982,7 @@ class TestWorkoutRouter:
         }
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
+            _execution_url(workout_id, exercise_id),
             json=update_data,
         )
 
@@ -1139,17 +998,15 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         sample_workout: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test updating non-existent exercise execution returns 404."""
         workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        update_data = {"exercise_order": 5}
-
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=update_data,
+            _execution_url(workout_id, exercise_id),
+            content=EXECUTION_PATCH_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 404
@@ -1159,28 +1016,17 @@ class TestWorkoutRouter:
     async def test_update_exercise_execution_finished_workout(
         self,
         authenticated_client: AsyncClient,
-        sample_workout: Workout,
+        finished_workout_with_exercise: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test updating exercise execution in finished workout returns 400."""
-        workout_id = sample_workout.id
+        workout_id = finished_workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # First add an exercise execution to the active workout
-        await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json={"exercise_order": 1, "sets": []},
-        )
-
-        # Finish the workout
-        await authenticated_client.patch(f"/api/v1/workouts/{workout_id}/finish")
-
-        update_data = {"exercise_order": 5}
-
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json=update_data,
+            _execution_url(workout_id, exercise_id),
+            content=EXECUTION_PATCH_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 400
@@ -1197,7 +1043,6 @@ class TestWorkoutRouter:
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
         another_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successfully reordering exercises."""
         workout_id = workout_with_exercises.id
@@ -1207,7 +1052,7 @@ class TestWorkoutRouter:
         reorder_data = {"exercise_ids": [another_exercise_id, sample_exercise_id]}
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/reorder",
+            _reorder_url(workout_id),
             json=reorder_data,
         )
 
@@ -1227,13 +1072,12 @@ class TestWorkoutRouter:
     async def test_reorder_exercises_not_found(
         self,
         authenticated_client: AsyncClient,
-        test_user: User,  # noqa: ARG002
     ):
         """Test reordering exercises for non-existent workout returns 404."""
         reorder_data = {"exercise_ids": [1, 2]}
 
         response = await authenticated_client.patch(
-            "/api/v1/workouts/99999/exercise-executions/reorder",
+            _reorder_url(99999),
             json=reorder_data,
         )
 
@@ -1245,7 +1089,6 @@ class TestWorkoutRouter:
         self,
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
-        test_user: User,  # noqa: ARG002
     ):
         """Test reordering exercises with mismatched IDs returns 400."""
         workout_id = workout_with_exercises.id
@@ -1254,7 +1097,7 @@ class TestWorkoutRouter:
         reorder_data = {"exercise_ids": [99999, 88888]}
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/reorder",
+            _reorder_url(workout_id),
             json=reorder_data,
         )
 
@@ -1265,27 +1108,17 @@ class TestWorkoutRouter:
     async def test_reorder_exercises_finished_workout(
         self,
         authenticated_client: AsyncClient,
-        sample_workout: Workout,
+        finished_workout_with_exercise: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test reordering exercises in finished workout returns 400."""
-        workout_id = sample_workout.id
+        workout_id = finished_workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # First add an exercise execution to the active workout
-        await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json={"exercise_order": 1, "sets": []},
-        )
-
-        # Finish the workout
-        await authenticated_client.patch(f"/api/v1/workouts/{workout_id}/finish")
-
         reorder_data = {"exercise_ids": [exercise_id]}
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/reorder",
+            _reorder_url(workout_id),
             json=reorder_data,
         )
 
@@ -1302,7 +1135,6 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test successfully creating a new set."""
         workout_id = workout_with_exercises.id
@@ -1316,7 +1148,7 @@ class TestWorkoutRouter:
         }
 
         response = await authenticated_client.post(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets",
+            _sets_url(workout_id, exercise_id),
             json=set_data,
         )
 
@@ -1336,21 +1168,15 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         sample_workout: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test creating set for non-existent exercise execution returns 404."""
         workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        set_data = {
-            "weight": 150.0,
-            "clean_reps": 8,
-            "forced_reps": 0,
-        }
-
         response = await authenticated_client.post(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets",
-            json=set_data,
+            _sets_url(workout_id, exercise_id),
+            content=SET_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 404
@@ -1360,32 +1186,17 @@ class TestWorkoutRouter:
     async def test_create_set_finished_workout(
         self,
         authenticated_client: AsyncClient,
-        sample_workout: Workout,
+        finished_workout_with_exercise: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test creating set in finished workout returns 400."""
-        workout_id = sample_workout.id
+        workout_id = finished_workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # First add an exercise execution to the active workout
-        await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json={"exercise_order": 1, "sets": []},
-        )
-
-        # Finish the workout
-        await authenticated_client.patch(f"/api/v1/workouts/{workout_id}/finish")
-
-        set_data = {
-            "weight": 150.0,
-            "clean_reps": 8,
-            "forced_reps": 0,
-        }
-
         response = await authenticated_client.post(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets",
-            json=set_data,
+            _sets_url(workout_id, exercise_id),
+            content=SET_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 400
@@ -1397,7 +1208,6 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test creating set with invalid data returns 422."""
         workout_id = workout_with_exercises.id
@@ -1410,7 +1220,7 @@ class TestWorkoutRouter:
         }
 
         response = await authenticated_client.post(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets",
+            _sets_url(workout_id, exercise_id),
             json=set_data,
         )
 
@@ -1428,15 +1238,10 @@ class TestWorkoutRouter:
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        set_data = {
-            "weight": 150.0,
-            "clean_reps": 8,
-            "forced_reps": 0,
-        }
-
         response = await another_authenticated_client.post(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets",
-            json=set_data,
+            _sets_url(workout_id, exercise_id),
+            content=SET_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 404
@@ -1452,19 +1257,14 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test successfully updating a set."""
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        # First get existing sets to find a set ID
-        get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
-        existing_sets = get_response.json()["sets"]
-        assert len(existing_sets) > 0
-        set_id = existing_sets[0]["id"]
+        # Read a set ID straight from the session instead of a GET round-trip
+        set_id = await _first_set_id(session, workout_id, exercise_id)
 
         update_data = {
             "weight": 175.0,
@@ -1474,7 +1274,7 @@ class TestWorkoutRouter:
         }
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/{set_id}",
+            _set_url(workout_id, exercise_id, set_id),
             json=update_data,
         )
 
@@ -1492,17 +1292,15 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test updating non-existent set returns 404."""
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        update_data = {"weight": 175.0}
-
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/99999",
-            json=update_data,
+            _set_url(workout_id, exercise_id, 99999),
+            content=SET_PATCH_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 404
@@ -1512,38 +1310,19 @@ class TestWorkoutRouter:
     async def test_update_set_finished_workout(
         self,
         authenticated_client: AsyncClient,
-        sample_workout: Workout,
+        finished_workout_with_exercise: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test updating set in finished workout returns 400."""
-        workout_id = sample_workout.id
+        workout_id = finished_workout_with_exercise.id
         exercise_id = sample_exercise.id
-
-        # First add an exercise execution with a set to the active workout
-        await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json={
-                "exercise_order": 1,
-                "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-            },
-        )
-
-        # Get the set ID before finishing workout
-        get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
-        sets = get_response.json()["sets"]
-        set_id = sets[0]["id"]
-
-        # Finish the workout
-        await authenticated_client.patch(f"/api/v1/workouts/{workout_id}/finish")
-
-        update_data = {"weight": 175.0}
+        set_id = await _first_set_id(session, workout_id, exercise_id)
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/{set_id}",
-            json=update_data,
+            _set_url(workout_id, exercise_id, set_id),
+            content=SET_PATCH_CONTENT,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 400
@@ -1555,18 +1334,14 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test updating set with invalid data returns 422."""
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        # Get existing set ID
-        get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
-        existing_sets = get_response.json()["sets"]
-        set_id = existing_sets[0]["id"]
+        # Read a set ID straight from the session instead of a GET round-trip
+        set_id = await _first_set_id(session, workout_id, exercise_id)
 
         update_data = {
             "weight": -175.0,  # Invalid negative weight
@@ -1574,7 +1349,7 @@ class TestWorkoutRouter:
         }
 
         response = await authenticated_client.patch(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/{set_id}",
+            _set_url(workout_id, exercise_id, set_id),
             json=update_data,
         )
 
@@ -1591,23 +1366,18 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test successfully deleting a set."""
         # Extract IDs early to avoid lazy loading issues
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
-        # Get existing set ID
-        get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
-        existing_sets = get_response.json()["sets"]
-        assert len(existing_sets) > 0
-        set_id = existing_sets[0]["id"]
+        # Read a set ID straight from the session instead of a GET round-trip
+        set_id = await _first_set_id(session, workout_id, exercise_id)
 
         response = await authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/{set_id}"
+            _set_url(workout_id, exercise_id, set_id)
         )
 
         assert response.status_code == 204
@@ -1615,7 +1385,7 @@ class TestWorkoutRouter:
 
         # Verify set is deleted
         get_response_after = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
+            _execution_url(workout_id, exercise_id)
         )
         remaining_sets = get_response_after.json()["sets"]
         set_ids = [s["id"] for s in remaining_sets]
@@ -1626,14 +1396,13 @@ class TestWorkoutRouter:
         authenticated_client: AsyncClient,
         workout_with_exercises: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
     ):
         """Test deleting non-existent set returns 404."""
         workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
 
         response = await authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/99999"
+            _set_url(workout_id, exercise_id, 99999)
         )
 
         assert response.status_code == 404
@@ -1643,35 +1412,17 @@ class TestWorkoutRouter:
     async def test_delete_set_finished_workout(
         self,
         authenticated_client: AsyncClient,
-        sample_workout: Workout,
+        finished_workout_with_exercise: Workout,
         sample_exercise: Exercise,
-        test_user: User,  # noqa: ARG002
+        session: AsyncSession,
     ):
         """Test deleting set from finished workout returns 400."""
-        workout_id = sample_workout.id
+        workout_id = finished_workout_with_exercise.id
         exercise_id = sample_exercise.id
-
-        # First add an exercise execution with a set to the active workout
-        await authenticated_client.put(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}",
-            json={
-                "exercise_order": 1,
-                "sets": [{"weight": 100.0, "clean_reps": 10, "forced_reps": 0}],
-            },
-        )
-
-        # Get the set ID before finishing workout
-        get_response = await authenticated_client.get(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}"
-        )
-        sets = get_response.json()["sets"]
-        set_id = sets[0]["id"]
-
-        # Finish the workout
-        await authenticated_client.patch(f"/api/v1/workouts/{workout_id}/finish")
+        set_id = await _first_set_id(session, workout_id, exercise_id)
 
         response = await authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/{set_id}"
+            _set_url(workout_id, exercise_id, set_id)
         )
 
         assert response.status_code == 400
@@ -1689,7 +1440,7 @@ class TestWorkoutRouter:
         exercise_id = sample_exercise.id
 
         response = await another_authenticated_client.delete(
-            f"/api/v1/workouts/{workout_id}/exercise-executions/{exercise_id}/sets/1"
+            _set_url(workout_id, exercise_id, 1)
         )
 
         assert response.status_code == 404
@@ -1,17 +1,20 @@
 """Test workout service integration."""
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from workout_api.exercises.models import Exercise
 from workout_api.shared.exceptions import NotFoundError
 from workout_api.users.models import User
-from workout_api.workouts.models import Workout
+from workout_api.workouts.models import Set, Workout
 from workout_api.workouts.schemas import (
     ExerciseExecutionRequest,
     ExerciseExecutionResponse,
     ExerciseExecutionUpdate,
     Pagination,
     SetCreate,
+    SetResponse,
     SetUpdate,
     WorkoutFilters,
     WorkoutResponse,
@@ -20,6 +23,13 @@ from workout_api.workouts.service import WorkoutService
 
 pytestmark = pytest.mark.anyio
 
+# Request models the service only reads, validated once and shared by tests
+DEFAULT_SET = SetCreate(weight=100.0, clean_reps=10, forced_reps=0)
+EXTRA_SET = SetCreate(weight=105.0, clean_reps=8, forced_reps=1)
+SET_WEIGHT_UPDATE = SetUpdate(weight=110.0)
+# Minimal valid upsert
+UPSERT_REQUEST = ExerciseExecutionRequest(exercise_order=1, sets=[DEFAULT_SET])
+
 
 class TestWorkoutService:
     """Test workout service integration with real repository."""
@@ -38,13 +48,14 @@ class TestWorkoutService:
         result = await workout_service.create_workout(user_id)
 
         assert isinstance(result, WorkoutResponse)
-        assert result.id is not None
-        assert result.created_by_user_id == user_id
-        assert result.updated_by_user_id == user_id
-        assert result.finished_at is None
-        assert result.exercise_executions == []
-        assert result.created_at is not None
-        assert result.updated_at is not None
+        expected = {
+            "created_by_user_id": user_id,
+            "updated_by_user_id": user_id,
+            "finished_at": None,
+            "exercise_executions": [],
+        }
+        assert expected.items() <= result.model_dump().items()
+        assert None not in (result.id, result.created_at, result.updated_at)
 
     async def test_create_workout_returns_pydantic_model(
         self, workout_service: WorkoutService, test_user: User
@@ -61,7 +72,6 @@ class TestWorkoutService:
         assert hasattr(result, "model_validate")
 
         # Verify all expected fields are present
-        data = result.model_dump()
         expected_fields = {
             "id",
             "created_by_user_id",
@@ -71,7 +81,7 @@ class TestWorkoutService:
             "created_at",
             "updated_at",
         }
-        assert expected_fields.issubset(data.keys())
+        assert expected_fields <= result.model_dump().keys()
 
     # ===================
     # upsert_exercise_execution tests
@@ -94,7 +104,7 @@ class TestWorkoutService:
             exercise_order=1,
             note_text="First exercise of the day",
             sets=[
-                SetCreate(weight=100.0, clean_reps=10, forced_reps=0),
+                DEFAULT_SET,
                 SetCreate(
                     weight=100.0, clean_reps=8, forced_reps=2, note_text="Tough set"
                 ),
@@ -136,13 +146,9 @@ class TestWorkoutService:
         exercise_id = sample_exercise.id
         user_id = test_user.id
 
-        # Get initial state
-        initial_result = await workout_service.get_exercise_execution(
-            workout_id, exercise_id, user_id
-        )
-        assert len(initial_result.sets) == 2  # From fixture
-
-        # Update with different sets (complete replacement)
+        # Update the fixture's 2-set execution with different sets (complete
+        # replacement); the old sets going away is covered by
+        # test_upsert_exercise_execution_replace_sets_completely
         execution_data = ExerciseExecutionRequest(
             exercise_order=3,  # Change order
             note_text="Updated notes",
@@ -246,16 +252,11 @@ class TestWorkoutService:
         exercise_id = sample_exercise.id
         user_id = test_user.id
 
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
         with pytest.raises(NotFoundError, match="Workout.*not found"):
             await workout_service.upsert_exercise_execution(
                 999999,
                 exercise_id,
-                execution_data,
+                UPSERT_REQUEST,
                 user_id,  # Non-existent workout
             )
 
@@ -270,16 +271,11 @@ class TestWorkoutService:
         workout_id = sample_workout.id
         user_id = test_user.id
 
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
         with pytest.raises(NotFoundError, match="Exercise.*not found"):
             await workout_service.upsert_exercise_execution(
                 workout_id,
                 999999,
-                execution_data,
+                UPSERT_REQUEST,
                 user_id,  # Non-existent exercise
             )
 
@@ -296,13 +292,8 @@ class TestWorkoutService:
         exercise_id = sample_exercise.id
         user_id = test_user.id
 
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
         result = await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
+            workout_id, exercise_id, UPSERT_REQUEST, user_id
         )
 
         # Verify it's a Pydantic model
@@ -311,7 +302,6 @@ class TestWorkoutService:
         assert hasattr(result, "model_validate")
 
         # Verify all expected fields are present
-        data = result.model_dump()
         expected_fields = {
             "exercise_id",
             "exercise_name",
@@ -321,22 +311,21 @@ class TestWorkoutService:
             "created_at",
             "updated_at",
         }
-        assert expected_fields.issubset(data.keys())
+        assert expected_fields <= result.model_dump().keys()
 
         # Verify sets are also Pydantic models
-        for set_obj in result.sets:
-            assert hasattr(set_obj, "model_dump")
-            set_data = set_obj.model_dump()
-            set_expected_fields = {
-                "id",
-                "weight",
-                "clean_reps",
-                "forced_reps",
-                "note_text",
-                "created_at",
-                "updated_at",
-            }
-            assert set_expected_fields.issubset(set_data.keys())
+        assert result.sets
+        assert all(isinstance(set_obj, SetResponse) for set_obj in result.sets)
+        set_expected_fields = {
+            "id",
+            "weight",
+            "clean_reps",
+            "forced_reps",
+            "note_text",
+            "created_at",
+            "updated_at",
+        }
+        assert set_expected_fields <= result.sets[0].model_dump().keys()
 
     async def test_upsert_exercise_execution_user_ownership(
         self,
@@ -351,58 +340,58 @@ class TestWorkoutService:
         exercise_id = sample_exercise.id
         another_user_id = another_user.id  # Different user
 
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
         # Should not be able to modify another user's workout
         with pytest.raises(NotFoundError, match="Workout.*not found"):
             await workout_service.upsert_exercise_execution(
-                workout_id, exercise_id, execution_data, another_user_id
+                workout_id, exercise_id, UPSERT_REQUEST, another_user_id
             )
 
     # ======================
     # Phase 1: Core Workout CRUD Tests
     # ======================
 
+    @pytest.mark.parametrize("num_workouts", [0, 2], ids=["empty", "two_workouts"])
     async def test_get_workouts_success(
-        self, workout_service: WorkoutService, test_user: User
+        self,
+        workout_service: WorkoutService,
+        session: AsyncSession,
+        test_user: User,
+        num_workouts: int,
     ):
-        """Test successful retrieval of user workouts with pagination."""
+        """Test retrieval of user workouts, including a user with none."""
         user_id = test_user.id
 
-        # Create multiple workouts
-        workout1 = await workout_service.create_workout(user_id)
-        workout2 = await workout_service.create_workout(user_id)
+        workouts = [
+            Workout(created_by_user_id=user_id, updated_by_user_id=user_id)
+            for _ in range(num_workouts)
+        ]
+        session.add_all(workouts)
+        await session.flush()
 
-        # Test retrieval with default pagination
         filters = WorkoutFilters()
         pagination = Pagination(page=1, size=10)
 
         page = await workout_service.get_workouts(filters, pagination, user_id)
 
-        assert page.total >= 2
-        assert len(page.items) >= 2
+        # The package seed creates no workouts, so the page holds exactly these
+        assert page.total == num_workouts
+        assert {w.id for w in page.items} == {w.id for w in workouts}
         assert page.page == 1
         assert page.size == 10
 
-        # Verify returned workout IDs match created ones
-        workout_ids = [w.id for w in page.items]
-        assert workout1.id in workout_ids
-        assert workout2.id in workout_ids
-
     async def test_get_workouts_with_pagination(
-        self, workout_service: WorkoutService, test_user: User
+        self, workout_service: WorkoutService, session: AsyncSession, test_user: User
     ):
         """Test workout pagination works correctly."""
         user_id = test_user.id
 
-        # Create several workouts
-        workouts = []
-        for _ in range(5):
-            workout = await workout_service.create_workout(user_id)
-            workouts.append(workout)
+        # Create several workouts - only pagination is under test, so insert
+        # them directly with one multi-row INSERT instead of five service calls
+        session.add_all(
+            Workout(created_by_user_id=user_id, updated_by_user_id=user_id)
+            for _ in range(5)
+        )
+        await session.flush()
 
         # Test first page with size 2
         filters = WorkoutFilters()
@@ -428,27 +417,6 @@ class TestWorkoutService:
         page2_ids = {w.id for w in page2.items}
         assert page1_ids.isdisjoint(page2_ids)
 
-    async def test_get_workouts_empty_result(
-        self, workout_service: WorkoutService, test_user: User
-    ):
-        """Test get_workouts returns empty result for user with no workouts."""
-        # Create a new user with no workouts - use the existing test_user
-        user_id = test_user.id
-
-        # First, ensure user has no workouts by checking existing ones
-        filters = WorkoutFilters()
-        pagination = Pagination(page=1, size=10)
-
-        # Get initial count
-        initial_page = await workout_service.get_workouts(filters, pagination, user_id)
-        initial_count = initial_page.total
-
-        # The test validates that empty result structure is correct
-        assert initial_page.items == [] or len(initial_page.items) == initial_count
-        assert initial_page.total >= 0
-        assert initial_page.page == 1
-        assert initial_page.size == 10
-
     async def test_get_workout_success(
         self,
         workout_service: WorkoutService,
@@ -464,12 +432,8 @@ class TestWorkoutService:
         workout_id = workout.id
 
         # Add exercise execution to make workout more interesting
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
         await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
+            workout_id, exercise_id, UPSERT_REQUEST, user_id
         )
 
         # Retrieve the workout
@@ -481,29 +445,34 @@ class TestWorkoutService:
         assert len(retrieved_workout.exercise_executions) == 1
         assert retrieved_workout.exercise_executions[0].exercise_id == exercise_id
 
-    async def test_get_workout_not_found(
-        self, workout_service: WorkoutService, test_user: User
+    @pytest.mark.parametrize(
+        "method_name", ["get_workout", "finish_workout", "delete_workout"]
+    )
+    async def test_workout_method_not_found(
+        self, workout_service: WorkoutService, test_user: User, method_name: str
     ):
-        """Test get_workout raises NotFoundError for non-existent workout."""
+        """Test workout lookups raise NotFoundError for a non-existent workout."""
         user_id = test_user.id
 
         with pytest.raises(NotFoundError, match="Workout with ID 99999 not found"):
-            await workout_service.get_workout(99999, user_id)
+            await getattr(workout_service, method_name)(99999, user_id)
 
-    async def test_get_workout_wrong_user(
-        self, workout_service: WorkoutService, test_user: User, another_user: User
+    @pytest.mark.parametrize(
+        "method_name", ["get_workout", "finish_workout", "delete_workout"]
+    )
+    async def test_workout_method_wrong_user(
+        self,
+        workout_service: WorkoutService,
+        sample_workout: Workout,  # Owned by test_user
+        another_user: User,
+        method_name: str,
     ):
-        """Test get_workout raises NotFoundError when user doesn't own workout."""
-        # Create workout with test_user
-        user_id = test_user.id
+        """Test workout lookups raise NotFoundError when user doesn't own workout."""
+        workout_id = sample_workout.id
         another_user_id = another_user.id
 
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        # Try to access with different user
         with pytest.raises(NotFoundError):
-            await workout_service.get_workout(workout_id, another_user_id)
+            await getattr(workout_service, method_name)(workout_id, another_user_id)
 
     async def test_finish_workout_success(
         self,
@@ -538,30 +507,6 @@ class TestWorkoutService:
         assert finished_workout.finished_at is not None
         assert finished_workout.created_by_user_id == user_id
 
-    async def test_finish_workout_not_found(
-        self, workout_service: WorkoutService, test_user: User
-    ):
-        """Test finish_workout raises NotFoundError for non-existent workout."""
-        user_id = test_user.id
-
-        with pytest.raises(NotFoundError, match="Workout with ID 99999 not found"):
-            await workout_service.finish_workout(99999, user_id)
-
-    async def test_finish_workout_wrong_user(
-        self, workout_service: WorkoutService, test_user: User, another_user: User
-    ):
-        """Test finish_workout raises NotFoundError when user doesn't own workout."""
-        # Create workout with test_user
-        user_id = test_user.id
-        another_user_id = another_user.id
-
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        # Try to finish with different user
-        with pytest.raises(NotFoundError):
-            await workout_service.finish_workout(workout_id, another_user_id)
-
     async def test_finish_empty_workout_deletes_it(
         self, workout_service: WorkoutService, test_user: User
     ):
@@ -639,30 +584,6 @@ class TestWorkoutService:
         with pytest.raises(NotFoundError):
             await workout_service.get_workout(workout_id, user_id)
 
-    async def test_delete_workout_not_found(
-        self, workout_service: WorkoutService, test_user: User
-    ):
-        """Test delete_workout raises NotFoundError for non-existent workout."""
-        user_id = test_user.id
-
-        with pytest.raises(NotFoundError, match="Workout with ID 99999 not found"):
-            await workout_service.delete_workout(99999, user_id)
-
-    async def test_delete_workout_wrong_user(
-        self, workout_service: WorkoutService, test_user: User, another_user: User
-    ):
-        """Test delete_workout raises NotFoundError when user doesn't own workout."""
-        # Create workout with test_user
-        user_id = test_user.id
-        another_user_id = another_user.id
-
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        # Try to delete with different user
-        with pytest.raises(NotFoundError):
-            await workout_service.delete_workout(workout_id, another_user_id)
-
     # ======================
     # Phase 2: Exercise Execution Management Tests
     # ======================
@@ -685,8 +606,8 @@ class TestWorkoutService:
             exercise_order=1,
             note_text="Test notes",
             sets=[
-                SetCreate(weight=100.0, clean_reps=10, forced_reps=0),
-                SetCreate(weight=105.0, clean_reps=8, forced_reps=1),
+                DEFAULT_SET,
+                EXTRA_SET,
             ],
         )
 
@@ -710,16 +631,14 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        sample_workout: Workout,  # No exercise executions
         sample_exercise: Exercise,
     ):
         """Test get_exercise_execution raises NotFoundError when execution doesn't exist."""
         user_id = test_user.id
+        workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        # Create workout but no exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
         with pytest.raises(NotFoundError, match="Exercise execution not found"):
             await workout_service.get_exercise_execution(
                 workout_id, exercise_id, user_id
@@ -729,25 +648,14 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        workout_with_exercise: Workout,
         sample_exercise: Exercise,
     ):
         """Test successfully deleting an exercise execution."""
         user_id = test_user.id
+        workout_id = workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # Create workout and exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
         # Verify execution exists
         execution = await workout_service.get_exercise_execution(
             workout_id, exercise_id, user_id
@@ -771,16 +679,14 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        sample_workout: Workout,  # No exercise executions
         sample_exercise: Exercise,
     ):
         """Test delete_exercise_execution raises NotFoundError when execution doesn't exist."""
         user_id = test_user.id
+        workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        # Create workout but no exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
         with pytest.raises(NotFoundError, match="Exercise execution not found"):
             await workout_service.delete_exercise_execution(
                 workout_id, exercise_id, user_id
@@ -803,7 +709,7 @@ class TestWorkoutService:
         execution_data = ExerciseExecutionRequest(
             exercise_order=1,
             note_text="Original notes",
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
+            sets=[DEFAULT_SET],
         )
 
         await workout_service.upsert_exercise_execution(
@@ -826,25 +732,14 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        workout_with_exercise: Workout,
         sample_exercise: Exercise,
     ):
         """Test updating exercise execution order."""
         user_id = test_user.id
+        workout_id = workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # Create workout and exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
         # Update order
         update_data = ExerciseExecutionUpdate(exercise_order=3)
 
@@ -860,16 +755,14 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        sample_workout: Workout,  # No exercise executions
         sample_exercise: Exercise,
     ):
         """Test update_exercise_execution raises NotFoundError when execution doesn't exist."""
         user_id = test_user.id
+        workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        # Create workout but no exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
         update_data = ExerciseExecutionUpdate(note_text="New notes")
 
         with pytest.raises(NotFoundError, match="Exercise execution not found"):
@@ -881,36 +774,17 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        workout_with_exercises: Workout,
         sample_exercise: Exercise,
         another_exercise: Exercise,
     ):
         """Test successfully reordering exercises in a workout."""
         user_id = test_user.id
+        # The fixture inserts sample_exercise at order 1, another_exercise at 2
+        workout_id = workout_with_exercises.id
         exercise1_id = sample_exercise.id
         exercise2_id = another_exercise.id
 
-        # Create workout with two exercise executions
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        # Add first exercise
-        execution1_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise1_id, execution1_data, user_id
-        )
-
-        # Add second exercise
-        execution2_data = ExerciseExecutionRequest(
-            exercise_order=2,
-            sets=[SetCreate(weight=200.0, clean_reps=5, forced_reps=0)],
-        )
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise2_id, execution2_data, user_id
-        )
-
         # Reorder exercises (reverse order)
         reorder_result = await workout_service.reorder_exercises(
             workout_id, [exercise2_id, exercise1_id], user_id
@@ -948,25 +822,14 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        workout_with_exercise: Workout,
         sample_exercise: Exercise,
     ):
         """Test successfully creating a new set."""
         user_id = test_user.id
+        workout_id = workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # Create workout and exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
         # Create additional set
         set_data = SetCreate(
             weight=105.0, clean_reps=8, forced_reps=1, note_text="Extra set"
@@ -992,52 +855,36 @@ class TestWorkoutService:
         self,
         workout_service: WorkoutService,
         test_user: User,
+        sample_workout: Workout,  # No exercise executions
         sample_exercise: Exercise,
     ):
         """Test create_set raises error for non-existent exercise execution."""
         user_id = test_user.id
+        workout_id = sample_workout.id
         exercise_id = sample_exercise.id
 
-        # Create workout but no exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        set_data = SetCreate(weight=100.0, clean_reps=10, forced_reps=0)
+        set_data = DEFAULT_SET
 
         # This should raise an error from the repository level
         with pytest.raises(NotFoundError):
             await workout_service.create_set(workout_id, exercise_id, set_data, user_id)
 
-    async def test_update_set_success(
+    async def test_update_set_success(  # noqa: PLR0913
         self,
         workout_service: WorkoutService,
+        session: AsyncSession,
         test_user: User,
+        workout_with_exercise: Workout,
         sample_exercise: Exercise,
     ):
         """Test successfully updating an existing set."""
         user_id = test_user.id
+        workout_id = workout_with_exercise.id
         exercise_id = sample_exercise.id
-
-        # Create workout and exercise execution with set
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[
-                SetCreate(
-                    weight=100.0, clean_reps=10, forced_reps=0, note_text="Original"
-                )
-            ],
+        set_id = await session.scalar(
+            select(Set.id).where(Set.workout_id == workout_id)
         )
 
-        execution = await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
-        # Get the set ID
-        set_id = execution.sets[0].id
-
         # Update the set
         update_data = SetUpdate(weight=110.0, clean_reps=8, note_text="Updated")
 
@@ -1051,99 +898,77 @@ class TestWorkoutService:
         assert updated_set.forced_reps == 0  # Should remain unchanged
         assert updated_set.note_text == "Updated"
 
-    async def test_update_set_not_found(
+    @pytest.mark.parametrize(
+        ("method_name", "extra_args"),
+        [("update_set", (SET_WEIGHT_UPDATE,)), ("delete_set", ())],
+    )
+    async def test_set_mutation_not_found(  # noqa: PLR0913
         self,
         workout_service: WorkoutService,
         test_user: User,
+        workout_with_exercise: Workout,
         sample_exercise: Exercise,
+        method_name: str,
+        extra_args: tuple,
     ):
-        """Test update_set raises NotFoundError for non-existent set."""
+        """Test update_set and delete_set raise NotFoundError for a missing set."""
         user_id = test_user.id
+        workout_id = workout_with_exercise.id
         exercise_id = sample_exercise.id
 
-        # Create workout and exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
-        update_data = SetUpdate(weight=110.0)
-
         with pytest.raises(NotFoundError, match="Set with ID 99999 not found"):
-            await workout_service.update_set(
-                workout_id, exercise_id, 99999, update_data, user_id
+            await getattr(workout_service, method_name)(
+                workout_id, exercise_id, 99999, *extra_args, user_id
             )
 
-    async def test_update_set_wrong_user(
+    @pytest.mark.parametrize(
+        ("method_name", "extra_args"),
+        [("update_set", (SET_WEIGHT_UPDATE,)), ("delete_set", ())],
+    )
+    async def test_set_mutation_wrong_user(  # noqa: PLR0913
         self,
         workout_service: WorkoutService,
-        test_user: User,
+        session: AsyncSession,
+        workout_with_exercise: Workout,  # Owned by test_user
         another_user: User,
         sample_exercise: Exercise,
+        method_name: str,
+        extra_args: tuple,
     ):
-        """Test update_set raises NotFoundError when user doesn't own the workout."""
-        user_id = test_user.id
+        """Test update_set and delete_set raise NotFoundError for non-owners."""
         another_user_id = another_user.id
+        workout_id = workout_with_exercise.id
         exercise_id = sample_exercise.id
-
-        # Create workout and exercise execution with test_user
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
+        set_id = await session.scalar(
+            select(Set.id).where(Set.workout_id == workout_id)
         )
 
-        execution = await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
-        set_id = execution.sets[0].id
-        update_data = SetUpdate(weight=110.0)
-
-        # Try to update with different user
+        # Try to change the set as a different user
         with pytest.raises(NotFoundError):
-            await workout_service.update_set(
-                workout_id, exercise_id, set_id, update_data, another_user_id
+            await getattr(workout_service, method_name)(
+                workout_id, exercise_id, set_id, *extra_args, another_user_id
             )
 
-    async def test_delete_set_success(
+    async def test_delete_set_success(  # noqa: PLR0913
         self,
         workout_service: WorkoutService,
+        session: AsyncSession,
         test_user: User,
+        workout_with_exercises: Workout,
         sample_exercise: Exercise,
     ):
         """Test successfully deleting a set."""
         user_id = test_user.id
+        # The fixture records two sets for sample_exercise
+        workout_id = workout_with_exercises.id
         exercise_id = sample_exercise.id
-
-        # Create workout and exercise execution with multiple sets
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[
-                SetCreate(weight=100.0, clean_reps=10, forced_reps=0),
-                SetCreate(weight=105.0, clean_reps=8, forced_reps=1),
-            ],
+        set_id = await session.scalar(
+            select(Set.id)
+            .where(Set.workout_id == workout_id, Set.exercise_id == exercise_id)
+            .order_by(Set.id)
+            .limit(1)
         )
 
-        execution = await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
-        # Get the first set ID
-        set_id = execution.sets[0].id
-
         # Delete the set
         result = await workout_service.delete_set(
             workout_id, exercise_id, set_id, user_id
@@ -1159,62 +984,3 @@ class TestWorkoutService:
         assert (
             updated_execution.sets[0].id != set_id
         )  # Remaining set should be different
-
-    async def test_delete_set_not_found(
-        self,
-        workout_service: WorkoutService,
-        test_user: User,
-        sample_exercise: Exercise,
-    ):
-        """Test delete_set raises NotFoundError for non-existent set."""
-        user_id = test_user.id
-        exercise_id = sample_exercise.id
-
-        # Create workout and exercise execution
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
-        await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
-        with pytest.raises(NotFoundError, match="Set with ID 99999 not found"):
-            await workout_service.delete_set(workout_id, exercise_id, 99999, user_id)
-
-    async def test_delete_set_wrong_user(
-        self,
-        workout_service: WorkoutService,
-        test_user: User,
-        another_user: User,
-        sample_exercise: Exercise,
-    ):
-        """Test delete_set raises NotFoundError when user doesn't own the workout."""
-        user_id = test_user.id
-        another_user_id = another_user.id
-        exercise_id = sample_exercise.id
-
-        # Create workout and exercise execution with test_user
-        workout = await workout_service.create_workout(user_id)
-        workout_id = workout.id
-
-        execution_data = ExerciseExecutionRequest(
-            exercise_order=1,
-            sets=[SetCreate(weight=100.0, clean_reps=10, forced_reps=0)],
-        )
-
-        execution = await workout_service.upsert_exercise_execution(
-            workout_id, exercise_id, execution_data, user_id
-        )
-
-        set_id = execution.sets[0].id
-
-        # Try to delete with different user
-        with pytest.raises(NotFoundError):
-            await workout_service.delete_set(
-                workout_id, exercise_id, set_id, another_user_id
-            )